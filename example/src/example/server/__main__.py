@@ -1,12 +1,35 @@
 """Entrypoint of flask server."""
 
 import logging
+import os
+from collections.abc import Callable
 
-from .processor import app
+from .request_log import configure_logging
 
-if __name__ == "__main__":
-    logging.basicConfig(
-        format="%(asctime)s %(name)s %(filename)s:%(lineno)d - %(message)s",
+LOG_FORMAT = "%(asctime)s %(name)s %(filename)s:%(lineno)d - %(message)s"
+
+
+def setup_logging() -> Callable[[], None]:
+    """Configure logging from the environment and return the function stopping it."""
+    listener = configure_logging(
+        fmt=LOG_FORMAT,
         level=logging.INFO,
+        structured=os.environ.get("LOG_STRUCTURED", "") not in {"", "0"},
+        sample_rate=float(os.environ.get("LOG_SAMPLE_RATE", "1.0")),
     )
-    app.run(host="0.0.0.0", port=80)  # noqa: S104
+    return listener.stop
+
+
+if __name__ == "__main__":
+    if os.environ.get("SERVER_MODE", "dev") == "prefork":
+        from .serving import ServingConfig, serve
+
+        logging.basicConfig(format=LOG_FORMAT, level=logging.INFO)  # Of the master
+        serve(ServingConfig(), setup=setup_logging)
+    else:
+        from . import dba
+        from .processor import app
+
+        setup_logging()
+        dba.init_pool()
+        app.run(host="0.0.0.0", port=int(os.environ.get("PORT", "80")))  # noqa: S104
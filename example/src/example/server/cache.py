@@ -0,0 +1,124 @@
+"""
+Optional caching of /compute responses.
+
+Enabled by the RESULT_CACHE_SIZE environment variable (or configure()) two bounded LRU
+caches let hot repeated requests skip the DB and the serialization:
+
+- operations maps (known) uuids to their operation.
+  Entries are invalidated by dba when the operation of a uuid changes in this
+  process and expire after RESULT_CACHE_TTL seconds to pick up changes made by
+  other processes (e.g. other workers or the tests) sharing the DB.
+  Unknown uuids aren't cached so operations injected by other processes are found
+  straight away.
+- results maps (operation, input) to the encoded response and its ETag.
+  Results only depend on the key so they never go stale.
+
+When disabled every lookup is a miss and nothing is stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from . import metrics
+
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", "0"))  # 0 disables
+RESULT_CACHE_TTL = float(os.environ.get("RESULT_CACHE_TTL", "60"))
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class CachedResponse(NamedTuple):
+    """Response (as logged), its encoded body and the body's (unquoted) ETag."""
+
+    response: dict[str, Any]
+    body: bytes
+    etag: str
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe LRU cache of at most size entries (optionally expiring)."""
+
+    def __init__(self, name: str, size: int, ttl: float | None = None) -> None:
+        """Create empty cache (name labels its metrics)."""
+        self.name = name
+        self.size = size
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: K) -> V:
+        """Get the value cached for key (KeyError on a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < time.monotonic():
+                del self._entries[key]  # Expired
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        result = "miss" if entry is None else "hit"
+        metrics.increment(
+            f'cache_requests_total{{cache="{self.name}",result="{result}"}}'
+        )
+        if entry is None:
+            raise KeyError(key)
+
+        return entry[0]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Cache value for key evicting the least recently used entry if full."""
+        if self.size <= 0:
+            return
+
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        """Remove the entry for key (if any)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+operations: LRUCache[int, str]
+results: LRUCache[tuple[str, type, int | float], CachedResponse]
+
+
+def configure(size: int = RESULT_CACHE_SIZE, ttl: float = RESULT_CACHE_TTL) -> None:
+    """(Re)create the caches holding size entries each (0 disables caching)."""
+    global operations, results  # noqa: PLW0603
+    operations = LRUCache("operation", size, ttl)
+    results = LRUCache("result", size)
+
+
+def enabled() -> bool:
+    """Whether responses are cached."""
+    return results.size > 0
+
+
+def invalidate_operation(uuid: int) -> None:
+    """Forget the operation cached for uuid (since it is being changed)."""
+    operations.discard(uuid)
+
+
+def etag(body: bytes) -> str:
+    """Compute the (unquoted) ETag of a response body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+configure()
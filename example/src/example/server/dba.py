@@ -1,50 +1,381 @@
-"""DB (Postgres) Accessor."""
+"""
+DB Accessor.
+
+The operations table lives behind a pluggable backend.
+By default this is Postgres but the DB_BACKEND environment variable (or set_backend())
+can switch it to an in-memory dict which allows the server (and its integration tests)
+to run without any containers.
+
+Postgres connections are opened per cursor unless a connection pool has been set up
+with init_pool() (which the pre-forking server does in each worker after the fork).
+"""
 
 from __future__ import annotations
 
 import os
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, cast
+import threading
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import psycopg
 
+from . import cache, metrics
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Sequence
 
 DB_USER = "postgres"
-DB_PASSWORD = os.environ["POSTGRES_PASSWORD"]
-DB_HOST = "db-host"
+DB_HOST = os.environ.get("DB_HOST", "db-host")
+DB_NAME = os.environ.get("DB_NAME", "postgres")
+DB_BACKEND = os.environ.get("DB_BACKEND", "postgres")
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "0"))  # 0 disables pooling
 
 
 Record = dict[str, Any]  # Object returned by cursor SELECT (using dict row)
 
 
-@contextmanager
-def get_cursor(autocommit: bool = False) -> Iterator[psycopg.Cursor[Record | None]]:
-    """Create cursor to postgres DB."""
+def set_database(name: str) -> str:
+    """Point the postgres backend at the named database returning the previous one."""
+    global DB_NAME
+    previous, DB_NAME = DB_NAME, name
+
+    return previous
+
+
+def _connect(autocommit: bool, dbname: str) -> psycopg.Connection[Any]:
+    """Open a new connection to the named postgres DB."""
     conn = psycopg.connect(
-        autocommit=autocommit, user=DB_USER, password=DB_PASSWORD, host=DB_HOST
+        autocommit=autocommit,
+        user=DB_USER,
+        password=os.environ["POSTGRES_PASSWORD"],
+        host=DB_HOST,
+        dbname=dbname,
     )
+    metrics.increment("dba_connections_total")
+
+    return conn
+
+
+class ConnectionPool:
+    """Thread-safe pool of at most size connections to a single postgres DB."""
+
+    def __init__(self, size: int, dbname: str) -> None:
+        """Create empty pool (connections are opened on demand)."""
+        self.size = size
+        self.dbname = dbname
+        self._idle: list[psycopg.Connection[Any]] = []
+        self._opened = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    @contextmanager
+    def connection(self, autocommit: bool) -> Iterator[psycopg.Connection[Any]]:
+        """Borrow a connection (waiting while all size of them are in use)."""
+        conn = self._acquire(autocommit)
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def close(self) -> None:
+        """Close the idle connections (the ones in use are closed when returned)."""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            self._update_gauges()
+
+        for conn in idle:
+            conn.close()
+
+    def _acquire(self, autocommit: bool) -> psycopg.Connection[Any]:
+        """Take an idle connection or open a new one if below size."""
+        with self._available:
+            while not self._idle and self._opened >= self.size:
+                self._available.wait()
+
+            if self._idle:
+                conn = self._idle.pop()  # Most recently used (least likely stale)
+            else:
+                self._opened += 1
+                conn = None
+            self._update_gauges()
+
+        if conn is None:
+            try:
+                conn = _connect(autocommit, self.dbname)
+            except BaseException:
+                self._discard()
+                raise
+
+        conn.autocommit = autocommit  # Allowed since idle connections are reset
+        return conn
+
+    def _release(self, conn: psycopg.Connection[Any]) -> None:
+        """Reset connection and return it to the pool (or close it if unusable)."""
+        if not conn.closed and not conn.broken:
+            # End the transaction implicitly begun (by reads) without autocommit
+            with suppress(psycopg.Error):
+                conn.rollback()
+
+        with self._available:
+            keep = not (self._closed or conn.closed or conn.broken)
+            if keep:
+                self._idle.append(conn)
+                self._update_gauges()
+                self._available.notify()
+
+        if not keep:
+            conn.close()
+            self._discard()
+
+    def _discard(self) -> None:
+        """Account for a connection that was closed (or failed to open)."""
+        with self._available:
+            self._opened -= 1
+            self._update_gauges()
+            self._available.notify()
+
+    def _update_gauges(self) -> None:
+        """Publish the number of idle and in use connections (lock held)."""
+        idle = len(self._idle)
+        metrics.set_gauge('dba_pool_connections{state="idle"}', idle)
+        metrics.set_gauge('dba_pool_connections{state="in_use"}', self._opened - idle)
+
+
+_pool: ConnectionPool | None = None
+
+
+def init_pool(size: int = DB_POOL_SIZE) -> None:
+    """Set up a pool of size connections to DB_NAME (replacing any previous one)."""
+    global _pool
+    previous, _pool = _pool, ConnectionPool(size, DB_NAME) if size > 0 else None
+    if previous is not None:
+        previous.close()
+
+
+def close_pool() -> None:
+    """Close the connection pool (if any) and go back to a connection per cursor."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+@contextmanager
+def get_cursor(
+    autocommit: bool = False, dbname: str | None = None
+) -> Iterator[psycopg.Cursor[Record | None]]:
+    """Create cursor to postgres DB (DB_NAME unless dbname is given)."""
+    dbname = dbname or DB_NAME
+    pool = _pool
+
+    if pool is not None and pool.dbname == dbname:
+        with (
+            pool.connection(autocommit) as conn,
+            conn.cursor(row_factory=psycopg.rows.dict_row) as cursor,
+        ):
+            yield cursor
+        return
+
+    conn = _connect(autocommit, dbname)
 
     # Yield a cursor that uses a dict row factory
     with conn.cursor(row_factory=psycopg.rows.dict_row) as cursor:
         yield cursor
 
 
+class Backend(Protocol):
+    """Storage for the operation assigned to each uuid."""
+
+    def get_operation(self, uuid: int) -> str | None:
+        """Get operation for given uuid (None if uuid is unknown)."""
+
+    def inject_operation(self, uuid: int, operation: str) -> None:
+        """Store operation for given uuid."""
+
+    def uninject_operation(self, uuid: int) -> None:
+        """Remove operation stored for given uuid."""
+
+    def inject_operations(self, rows: Iterable[tuple[int, str]]) -> None:
+        """Store (uuid, operation) rows in bulk."""
+
+    def uninject_operations(self, uuids: Sequence[int]) -> None:
+        """Remove operations stored for all given uuids in bulk."""
+
+
+class PostgresBackend:
+    """Backend storing operations in the postgres operations table."""
+
+    def get_operation(self, uuid: int) -> str | None:
+        """Get operation for given uuid from operations table."""
+        with get_cursor() as cursor:
+            query = """
+                SELECT
+                    operation
+                FROM operations
+                WHERE
+                    uuid=%(uuid)s
+            """
+            cursor.execute(query, {"uuid": uuid})
+            record = cursor.fetchone()
+
+        if record:
+            return cast("str", record["operation"])
+
+        return None  # indicates that uuid is not in table
+
+    def inject_operation(self, uuid: int, operation: str) -> None:
+        """Insert uuid and operation into operations table."""
+        with get_cursor(autocommit=True) as cursor:
+            query = """
+                INSERT
+                    INTO operations
+                    (
+                        uuid,
+                        operation
+                    )
+                VALUES
+                    (
+                        %(uuid)s,
+                        %(operation)s
+                    )
+            """
+            cursor.execute(query, {"uuid": uuid, "operation": operation})
+
+    def uninject_operation(self, uuid: int) -> None:
+        """Delete row for uuid from operations table."""
+        with get_cursor(autocommit=True) as cursor:
+            query = """
+                DELETE
+                    FROM operations
+                WHERE
+                    uuid=%(uuid)s
+            """
+            cursor.execute(query, {"uuid": uuid})
+
+    def inject_operations(self, rows: Iterable[tuple[int, str]]) -> None:
+        """Stream rows into operations table with a single COPY."""
+        with (
+            get_cursor(autocommit=True) as cursor,
+            cursor.copy("COPY operations (uuid, operation) FROM STDIN") as copy,
+        ):
+            for row in rows:
+                copy.write_row(row)
+
+    def uninject_operations(self, uuids: Sequence[int]) -> None:
+        """Delete rows for all uuids from operations table in a single statement."""
+        with get_cursor(autocommit=True) as cursor:
+            query = """
+                DELETE
+                    FROM operations
+                WHERE
+                    uuid = ANY(%(uuids)s)
+            """
+            cursor.execute(query, {"uuids": list(uuids)})
+
+
+class MemoryBackend:
+    """Backend storing operations in a dict (in-process, no persistence)."""
+
+    def __init__(self) -> None:
+        """Create an empty operations store."""
+        self._operations: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def get_operation(self, uuid: int) -> str | None:
+        """Get operation for given uuid from the dict."""
+        return self._operations.get(uuid)
+
+    def inject_operation(self, uuid: int, operation: str) -> None:
+        """Store operation for uuid (uuid must be unique like the table column)."""
+        with self._lock:
+            if uuid in self._operations:
+                err_msg = f"Operation already exists for uuid: {uuid}"
+                raise ValueError(err_msg)
+
+            self._operations[uuid] = operation
+
+    def uninject_operation(self, uuid: int) -> None:
+        """Remove operation for uuid (if present)."""
+        with self._lock:
+            self._operations.pop(uuid, None)
+
+    def inject_operations(self, rows: Iterable[tuple[int, str]]) -> None:
+        """Store all rows (all or nothing if any uuid already exists)."""
+        new = dict(rows)
+
+        with self._lock:
+            if clash := new.keys() & self._operations.keys():
+                err_msg = f"Operation already exists for uuids: {sorted(clash)}"
+                raise ValueError(err_msg)
+
+            self._operations.update(new)
+
+    def uninject_operations(self, uuids: Sequence[int]) -> None:
+        """Remove operations for all uuids (if present)."""
+        with self._lock:
+            for uuid in uuids:
+                self._operations.pop(uuid, None)
+
+
+BACKENDS: dict[str, type[Backend]] = {
+    "postgres": PostgresBackend,
+    "memory": MemoryBackend,
+}
+
+
+def create_backend(name: str) -> Backend:
+    """Create backend from its name (one of the keys of BACKENDS)."""
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        err_msg = f"Unknown DB backend: {name} (choose from {', '.join(BACKENDS)})"
+        raise ValueError(err_msg) from None
+
+
+_backend: Backend = create_backend(DB_BACKEND)
+
+
+def set_backend(backend: Backend) -> Backend:
+    """Replace the active backend returning the previous one (to allow restoring)."""
+    global _backend
+    previous, _backend = _backend, backend
+
+    return previous
+
+
 def get_operation(uuid: int) -> str | None:
-    """Get operation for given uuid from operations table."""
-    with get_cursor() as cursor:
-        query = """
-            SELECT
-                operation
-            FROM operations
-            WHERE
-                uuid=%(uuid)s
-        """
-        cursor.execute(query, {"uuid": uuid})
-        record = cursor.fetchone()
-
-    if record:
-        return cast("str", record["operation"])
-
-    return None  # indicates that uuid is not in table
+    """Get operation for given uuid from the active backend."""
+    return _backend.get_operation(uuid)
+
+
+def inject_operation(uuid: int, operation: str) -> None:
+    """Store operation for given uuid in the active backend."""
+    cache.invalidate_operation(uuid)
+    _backend.inject_operation(uuid, operation)
+
+
+def uninject_operation(uuid: int) -> None:
+    """Remove operation for given uuid from the active backend."""
+    cache.invalidate_operation(uuid)
+    _backend.uninject_operation(uuid)
+
+
+def _invalidating(rows: Iterable[tuple[int, str]]) -> Iterator[tuple[int, str]]:
+    """Pass rows through invalidating the cached operation of each uuid."""
+    for row in rows:
+        cache.invalidate_operation(row[0])
+        yield row
+
+
+def inject_operations(rows: Iterable[tuple[int, str]]) -> None:
+    """Store (uuid, operation) rows in bulk in the active backend."""
+    _backend.inject_operations(_invalidating(rows))
+
+
+def uninject_operations(uuids: Sequence[int]) -> None:
+    """Remove operations for all given uuids in bulk from the active backend."""
+    for uuid in uuids:
+        cache.invalidate_operation(uuid)
+    _backend.uninject_operations(uuids)
@@ -0,0 +1,129 @@
+"""
+In-process metrics exposed in the Prometheus text format.
+
+Metrics are only collected when enabled (METRICS_ENABLED env var or set_enabled()).
+When disabled every recording function returns immediately so the overhead on the
+request path is a single attribute check.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+# Upper bounds (in seconds) of the latency histogram buckets
+BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+# Phases of a /compute request whose latency is tracked
+PHASES = ("decode", "db", "compute", "serialize", "total")
+
+enabled = os.environ.get("METRICS_ENABLED", "") not in {"", "0"}
+
+
+class Histogram:
+    """Thread-safe latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS) -> None:
+        """Create empty histogram with given bucket upper bounds."""
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)  # Last one is the +Inf bucket
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        index = bisect_left(self._buckets, value)
+
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def render(self, name: str, labels: str) -> list[str]:
+        """Render samples (cumulative buckets, sum, and count) for this histogram."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        lines = []
+        cumulative = 0
+        bounds = [str(bound) for bound in self._buckets] + ["+Inf"]
+        for bound, count in zip(bounds, counts, strict=True):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+
+        lines.append(f"{name}_sum{{{labels}}} {total}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+
+        return lines
+
+
+_phases = {phase: Histogram() for phase in PHASES}
+_counters: defaultdict[str, float] = defaultdict(float)
+_gauges: dict[str, float] = {}
+_counters_lock = threading.Lock()
+
+_HELP = {
+    "cache_requests_total": "Number of /compute cache lookups by cache and result",
+    "compute_phase_seconds": "Latency of the phases of /compute requests",
+    "dba_connections_total": "Number of DB connections opened",
+    "dba_pool_connections": "Number of pooled DB connections by state",
+}
+
+
+def set_enabled(flag: bool) -> None:
+    """Enable or disable collection of metrics."""
+    global enabled  # noqa: PLW0603
+    enabled = flag
+
+
+def observe_phase(phase: str, seconds: float) -> None:
+    """Record latency of a phase of a /compute request."""
+    if enabled:
+        _phases[phase].observe(seconds)
+
+
+def increment(sample: str, amount: float = 1) -> None:
+    """Increment counter identified by sample (metric name with optional labels)."""
+    if enabled:
+        with _counters_lock:
+            _counters[sample] += amount
+
+
+def set_gauge(sample: str, value: float) -> None:
+    """Set gauge identified by sample (metric name with optional labels)."""
+    if enabled:
+        _gauges[sample] = value
+
+
+def _render_samples(samples: dict[str, float], kind: str) -> list[str]:
+    """Render counter or gauge samples grouped by metric name."""
+    lines = []
+    seen = set()
+    for sample, value in sorted(samples.items()):
+        name = sample.split("{", 1)[0]
+        if name not in seen:
+            seen.add(name)
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        lines.append(f"{sample} {value}")
+
+    return lines
+
+
+def render() -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    name = "compute_phase_seconds"
+    lines = [f"# HELP {name} {_HELP[name]}", f"# TYPE {name} histogram"]
+    for phase, histogram in _phases.items():
+        lines.extend(histogram.render(name, f'phase="{phase}"'))
+
+    with _counters_lock:
+        counters = dict(_counters)
+
+    lines.extend(_render_samples(counters, "counter"))
+    lines.extend(_render_samples(dict(_gauges), "gauge"))
+
+    return "\n".join(lines) + "\n"
@@ -1,10 +1,13 @@
 """Request processor of flask server."""
 
 import logging
+import time
+from contextlib import suppress
+from typing import Any
 
 from flask import Flask, Response, jsonify, request
 
-from . import dba
+from . import cache, dba, metrics, request_log, serialization
 
 logger = logging.getLogger(__name__)
 app = Flask(__name__)
@@ -17,33 +20,126 @@ def process_test() -> Response:
     return jsonify(response)
 
 
-@app.route("/compute", methods=["POST"])
-def process_compute() -> Response:
-    """Fetch operation corresponding to uuid and apply it."""
-    payload = request.json
-    logger.info("Request to /compute: %s", payload)
+@app.route("/metrics")
+def process_metrics() -> Response:
+    """Expose metrics in the Prometheus text format (404 when disabled)."""
+    if not metrics.enabled:
+        return Response("metrics are disabled\n", status=404, mimetype="text/plain")
+
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+def _get_operation(uuid: int) -> str | None:
+    """Get operation for uuid (from the cache if enabled, else the DB)."""
+    if not cache.enabled():
+        return dba.get_operation(uuid)
 
-    uuid = payload["uuid"]
-    value = payload["input"]
+    try:
+        return cache.operations[uuid]
+    except KeyError:
+        operation = dba.get_operation(uuid)
 
-    operation = dba.get_operation(uuid)
-    logger.info("operation for uuid %s from db: %s", uuid, operation)
+    # Unknown uuids aren't cached since another process may inject them at any time
+    if operation is not None:
+        cache.operations[uuid] = operation
 
+    return operation
+
+
+def _compute(operation: str | None, uuid: int, value: float) -> dict[str, Any]:
+    """Apply operation to value building the response."""
     match operation:
         case "identity":
-            response = {"result": value}
+            return {"result": value}
 
         case "square":
-            response = {"result": value * value}
+            return {"result": value * value}
 
         case "cube":
-            response = {"result": value * value * value}
+            return {"result": value * value * value}
 
         case _:
-            response = {
-                "error": {"message": f"Unable to find operation for uuid: {uuid}"}
-            }
+            return {"error": {"message": f"Unable to find operation for uuid: {uuid}"}}
 
-    logger.info("Response from /computer: %s", response)
 
-    return jsonify(response)
+@app.route("/compute", methods=["POST"])
+def process_compute() -> Response:
+    """Fetch operation corresponding to uuid and apply it."""
+    start = time.perf_counter()
+    try:
+        compute = serialization.decode_compute(request.get_data(cache=False))
+    except serialization.PayloadError as exc:
+        error = {"error": {"message": f"Invalid payload: {exc}"}}
+        return Response(
+            serialization.encode(error), status=400, mimetype="application/json"
+        )
+
+    uuid = compute.uuid
+    value = compute.input
+
+    db_start = time.perf_counter()
+    operation = _get_operation(uuid)
+    db_end = time.perf_counter()
+
+    # Results only depend on the operation and input (whose type sets the encoding)
+    key = (operation, type(value), value) if operation is not None else None
+    cached = None
+    if key is not None and cache.enabled():
+        with suppress(KeyError):
+            cached = cache.results[key]
+
+    if cached is None:
+        response = _compute(operation, uuid, value)
+        compute_end = time.perf_counter()
+        body = serialization.encode(response)
+        if key is not None and cache.enabled():
+            cached = cache.results[key] = cache.CachedResponse(
+                response, body, cache.etag(body)
+            )
+    else:
+        response, body = cached.response, cached.body
+        compute_end = time.perf_counter()
+
+    if cached is not None and request.if_none_match.contains(cached.etag):
+        # The client already has this response, which RFC 9110 (13.1.2) signals
+        # with 412 rather than 304 for methods other than GET and HEAD
+        error = {"error": {"message": "Precondition failed: response unchanged"}}
+        output = Response(
+            serialization.encode(error), status=412, mimetype="application/json"
+        )
+    else:
+        output = Response(body, mimetype="application/json")
+    if cached is not None:
+        output.set_etag(cached.etag)
+    end = time.perf_counter()
+
+    if metrics.enabled:
+        metrics.observe_phase("decode", db_start - start)
+        metrics.observe_phase("db", db_end - db_start)
+        metrics.observe_phase("compute", compute_end - db_end)
+        metrics.observe_phase("serialize", end - compute_end)
+        metrics.observe_phase("total", end - start)
+
+    if request_log.sampled():
+        # Formatting (of the message and fields) is deferred to the logging thread
+        payload = {"uuid": uuid, "input": value}
+        logger.info(
+            "/compute uuid %s operation %s: %s -> %s",
+            uuid,
+            operation,
+            payload,
+            response,
+            extra={
+                "fields": {
+                    "endpoint": "/compute",
+                    "uuid": uuid,
+                    "operation": operation,
+                    "payload": payload,
+                    "response": response,
+                    "db_ms": (db_end - db_start) * 1000,
+                    "total_ms": (end - start) * 1000,
+                }
+            },
+        )
+
+    return output
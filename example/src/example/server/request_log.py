@@ -0,0 +1,96 @@
+"""
+Cheap request logging for the hot path.
+
+Each request emits (at most) a single record carrying its fields (payload, response,
+timings) as structured data.
+Requests are sampled so that only a configurable fraction of them are logged at all.
+Records are handed off to a queue and formatted and written by a background thread
+so neither serialization nor I/O blocks the request thread.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+_sample_rate = 1.0
+
+
+def sampled() -> bool:
+    """Decide (once per request) whether this request is to be logged."""
+    return _sample_rate >= 1.0 or random.random() < _sample_rate  # noqa: S311
+
+
+class StructuredFormatter(logging.Formatter):
+    """Format records as single line JSON objects including their fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize record (and the fields attached via extra) to JSON."""
+        entry: dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler which leaves formatting to the listener thread.
+
+    The stock QueueHandler formats the record in the calling thread (to make it
+    picklable), which is exactly the cost we want off the request thread.
+    The queue never leaves the process so the record can be enqueued as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record untouched."""
+        return record
+
+
+def configure_logging(
+    fmt: str,
+    level: int = logging.INFO,
+    structured: bool = False,
+    sample_rate: float = 1.0,
+) -> QueueListener:
+    """
+    Route all logging through a background thread.
+
+    Args:
+        fmt: Format used for plain (non-structured) records
+        level: Level of the root logger
+        structured: Whether to emit records as JSON objects
+        sample_rate: Fraction (0 to 1) of requests that are logged
+
+    Returns:
+        The started listener (stopped automatically at exit)
+
+    """
+    global _sample_rate  # noqa: PLW0603
+    _sample_rate = sample_rate
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        StructuredFormatter() if structured else logging.Formatter(fmt)
+    )
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener.start()
+    atexit.register(listener.stop)
+
+    return listener
@@ -0,0 +1,176 @@
+"""
+JSON serialization of requests and responses.
+
+Encoding and decoding go through a pluggable codec.
+By default the fastest installed library is used (msgspec, then orjson, falling back
+to the stdlib json module) but the JSON_CODEC environment variable (or set_codec())
+can pick one explicitly.
+Decoding validates the /compute payload into a typed ComputeRequest so malformed
+requests are rejected before any DB work.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+JSON_CODEC = os.environ.get("JSON_CODEC", "auto")
+
+
+class PayloadError(ValueError):
+    """Request body is not valid JSON or doesn't match the expected schema."""
+
+
+@dataclass(frozen=True, slots=True)
+class ComputeRequest:
+    """Payload of a /compute request."""
+
+    uuid: int
+    input: int | float
+
+
+def _validate(payload: Any) -> ComputeRequest:  # noqa: ANN401
+    """Validate decoded payload (as produced by json.loads) into a ComputeRequest."""
+    if not isinstance(payload, dict):
+        err_msg = "Expected a JSON object"
+        raise PayloadError(err_msg)
+
+    uuid = payload.get("uuid")
+    value = payload.get("input")
+
+    # bool is a subclass of int but true/false aren't valid here
+    if not isinstance(uuid, int) or isinstance(uuid, bool):
+        err_msg = "Expected `int` for `uuid`"
+        raise PayloadError(err_msg)
+    if not isinstance(value, int | float) or isinstance(value, bool):
+        err_msg = "Expected `int | float` for `input`"
+        raise PayloadError(err_msg)
+
+    return ComputeRequest(uuid, value)
+
+
+class Codec(Protocol):
+    """Encoder of responses and decoder of requests."""
+
+    def decode_compute(self, body: bytes) -> ComputeRequest:
+        """Decode and validate /compute request body (raise PayloadError if invalid)."""
+
+    def encode(self, response: dict[str, Any]) -> bytes:
+        """Encode response as JSON."""
+
+
+class StdlibCodec:
+    """Codec using the stdlib json module."""
+
+    def decode_compute(self, body: bytes) -> ComputeRequest:
+        """Decode body with json.loads and validate it."""
+        try:
+            payload = json.loads(body)
+        except ValueError as exc:
+            raise PayloadError(str(exc)) from None
+
+        return _validate(payload)
+
+    def encode(self, response: dict[str, Any]) -> bytes:
+        """Encode response with json.dumps."""
+        return json.dumps(response, separators=(",", ":")).encode()
+
+
+class OrjsonCodec:
+    """Codec using orjson."""
+
+    def __init__(self) -> None:
+        """Import orjson."""
+        import orjson  # noqa: PLC0415  # Optional dependency
+
+        self._orjson = orjson
+
+    def decode_compute(self, body: bytes) -> ComputeRequest:
+        """Decode body with orjson.loads and validate it."""
+        try:
+            payload = self._orjson.loads(body)
+        except self._orjson.JSONDecodeError as exc:
+            raise PayloadError(str(exc)) from None
+
+        return _validate(payload)
+
+    def encode(self, response: dict[str, Any]) -> bytes:
+        """Encode response with orjson.dumps."""
+        encoded: bytes = self._orjson.dumps(response)
+        return encoded
+
+
+class MsgspecCodec:
+    """Codec using msgspec (decoding and validating in a single pass)."""
+
+    def __init__(self) -> None:
+        """Import msgspec and build the typed decoder."""
+        import msgspec  # noqa: PLC0415  # Optional dependency
+
+        self._error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder(ComputeRequest)
+        self._encoder = msgspec.json.Encoder()
+
+    def decode_compute(self, body: bytes) -> ComputeRequest:
+        """Decode body straight into a ComputeRequest."""
+        try:
+            request: ComputeRequest = self._decoder.decode(body)
+        except self._error as exc:  # Also raised for schema mismatches
+            raise PayloadError(str(exc)) from None
+
+        return request
+
+    def encode(self, response: dict[str, Any]) -> bytes:
+        """Encode response with msgspec."""
+        encoded: bytes = self._encoder.encode(response)
+        return encoded
+
+
+CODECS: dict[str, type[Codec]] = {
+    "msgspec": MsgspecCodec,
+    "orjson": OrjsonCodec,
+    "json": StdlibCodec,
+}
+
+
+def create_codec(name: str) -> Codec:
+    """Create codec from its name (one of the keys of CODECS, or auto)."""
+    if name == "auto":
+        name = next(
+            (
+                candidate
+                for candidate in ("msgspec", "orjson")
+                if importlib.util.find_spec(candidate) is not None
+            ),
+            "json",
+        )
+
+    try:
+        return CODECS[name]()
+    except KeyError:
+        err_msg = f"Unknown JSON codec: {name} (choose from auto, {', '.join(CODECS)})"
+        raise ValueError(err_msg) from None
+
+
+_codec: Codec = create_codec(JSON_CODEC)
+
+
+def set_codec(codec: Codec) -> Codec:
+    """Replace the active codec returning the previous one (to allow restoring)."""
+    global _codec
+    previous, _codec = _codec, codec
+
+    return previous
+
+
+def decode_compute(body: bytes) -> ComputeRequest:
+    """Decode and validate /compute request body with the active codec."""
+    return _codec.decode_compute(body)
+
+
+def encode(response: dict[str, Any]) -> bytes:
+    """Encode response as JSON with the active codec."""
+    return _codec.encode(response)
@@ -0,0 +1,302 @@
+"""
+Pre-forking production server.
+
+The master process binds the listening socket and forks workers which all accept
+connections on it (so the kernel spreads them across the cores) and handle requests
+on a bounded pool of threads.
+The app is imported in each worker after the fork, so each sets up its own DB
+connection pool and logging thread.
+
+Signals sent to the master:
+
+- SIGHUP gracefully reloads: fresh workers (importing the current code) are started
+  and then the old ones finish their in-flight requests and exit.
+- SIGTERM and SIGINT gracefully shut down.
+
+Workers exiting unexpectedly are replaced.
+Workers not done within graceful_timeout of being asked to stop are killed.
+POSIX only (relies on os.fork()).
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import select
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType
+
+    from _typeshed.wsgi import WSGIApplication
+
+logger = logging.getLogger(__name__)
+
+SIGNALS = (signal.SIGCHLD, signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
+RESPAWN_INTERVAL = 1.0  # Seconds between replacing workers which exited unexpectedly
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read integer from environment variable name (default if unset or empty)."""
+    return int(os.environ.get(name) or default)
+
+
+@dataclass(frozen=True)
+class ServingConfig:
+    """Configuration of the pre-forking server (defaults read from the environment)."""
+
+    host: str = field(default_factory=lambda: os.environ.get("HOST", "0.0.0.0"))  # noqa: S104
+    port: int = field(default_factory=lambda: _env_int("PORT", 80))
+    workers: int = field(
+        default_factory=lambda: _env_int("SERVER_WORKERS", os.cpu_count() or 1)
+    )
+    threads: int = field(default_factory=lambda: _env_int("SERVER_THREADS", 8))
+    # Size of the DB connection pool of each worker (0 for its number of threads)
+    pool_size: int = field(default_factory=lambda: _env_int("DB_POOL_SIZE", 0))
+    graceful_timeout: float = field(
+        default_factory=lambda: float(os.environ.get("GRACEFUL_TIMEOUT") or 30)
+    )
+    # Idle keep-alive connections are closed after this (freeing their thread)
+    keepalive_timeout: float = field(
+        default_factory=lambda: float(os.environ.get("KEEPALIVE_TIMEOUT") or 5)
+    )
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """WSGI server handling connections on a fixed size pool of threads."""
+
+    multithread = True  # Enables HTTP/1.1 keep-alive
+
+    def __init__(
+        self,
+        app: WSGIApplication,
+        sock: socket.socket,
+        threads: int,
+        timeout: float,
+    ) -> None:
+        """Serve app on the (already listening) sock."""
+        self._executor = ThreadPoolExecutor(threads, thread_name_prefix="request")
+        handler = type("Handler", (WSGIRequestHandler,), {"timeout": timeout})
+        host, port = sock.getsockname()[:2]
+        super().__init__(host, port, app, handler=handler, fd=sock.fileno())
+
+    def process_request(self, request: Any, client_address: Any) -> None:  # noqa: ANN401
+        """Handle connection on a pool thread."""
+        self._executor.submit(self._process, request, client_address)
+
+    def _process(self, request: Any, client_address: Any) -> None:  # noqa: ANN401
+        """Handle all requests of a connection and close it."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001  # Reported like the single threaded server
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Serve until shutdown() then wait for the in-flight connections to finish."""
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._executor.shutdown(wait=True)
+
+
+def _run_worker(
+    sock: socket.socket,
+    config: ServingConfig,
+    app_path: str,
+    setup: Callable[[], Callable[[], None] | None],
+) -> None:
+    """Serve requests (in a forked worker) until asked to stop with SIGTERM."""
+    # Undo the master's signal handling
+    signal.set_wakeup_fd(-1)
+    for signo in SIGNALS:
+        signal.signal(signo, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C is handled by the master
+
+    # The master's log handlers are replaced by the ones set up for the worker
+    logging.getLogger().handlers.clear()
+    cleanup = setup()
+
+    module_name, _, attribute = app_path.partition(":")
+    app = getattr(importlib.import_module(module_name), attribute)
+
+    # Imported here (rather than at the top) so that the master never imports the app
+    from . import dba  # noqa: PLC0415
+
+    dba.init_pool(config.pool_size or config.threads)
+
+    server = PooledWSGIServer(app, sock, config.threads, config.keepalive_timeout)
+
+    def _stop(_signo: int, _frame: FrameType | None) -> None:
+        """Stop serving (from another thread since shutdown() waits for the loop)."""
+        threading.Thread(target=server.shutdown).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    try:
+        server.serve_forever()  # Returns once in-flight requests are done
+    finally:
+        dba.close_pool()
+        if cleanup is not None:
+            cleanup()
+
+
+class Master:
+    """Master process forking and supervising the workers."""
+
+    def __init__(
+        self,
+        config: ServingConfig,
+        app_path: str,
+        setup: Callable[[], Callable[[], None] | None],
+    ) -> None:
+        """Prepare serving the app at app_path ("module:attribute") with config."""
+        self.config = config
+        self.app_path = app_path
+        self.setup = setup
+        self.workers: set[int] = set()
+        self._retiring: dict[int, float] = {}  # pid -> deadline to exit by
+        self._next_replacement = 0.0  # Throttles replacing workers that crash
+        self._stopping = False
+        self._sock: socket.socket
+
+    def run(self) -> None:
+        """Serve until SIGTERM (or SIGINT)."""
+        self._sock = socket.create_server(
+            (self.config.host, self.config.port), backlog=2048
+        )
+
+        # Signals are received through a pipe so the loop below handles them in turn
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        signal.set_wakeup_fd(write_fd)
+        for signo in SIGNALS:
+            signal.signal(signo, lambda _signo, _frame: None)
+
+        try:
+            self._spawn_workers()
+            logger.info(
+                "Serving on %s:%s with %s workers of %s threads",
+                self.config.host,
+                self.config.port,
+                self.config.workers,
+                self.config.threads,
+            )
+
+            while self.workers or self._retiring:
+                readable, _, _ = select.select([read_fd], [], [], 1.0)
+                if readable:
+                    for received in os.read(read_fd, 64):
+                        self._handle(received)
+
+                self._reap()
+                self._kill_overdue()
+                self._replace_workers()
+
+        finally:
+            signal.set_wakeup_fd(-1)
+            os.close(read_fd)
+            os.close(write_fd)
+            self._sock.close()
+
+    def _spawn_workers(self) -> None:
+        """Fork workers until there are as many as configured."""
+        while len(self.workers) < self.config.workers:
+            self.workers.add(self._spawn())
+
+    def _spawn(self) -> int:
+        """Fork a worker and return its pid."""
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                _run_worker(self._sock, self.config, self.app_path, self.setup)
+                code = 0
+            except BaseException:
+                logger.exception("Worker %s failed", os.getpid())
+            finally:
+                os._exit(code)
+
+        return pid
+
+    def _handle(self, signo: int) -> None:
+        """Act on a signal received by the master."""
+        if signo == signal.SIGHUP and not self._stopping:
+            logger.info("Reloading workers")
+            old = self.workers
+            self.workers = set()
+            self._spawn_workers()
+            self._retire(old)
+
+        elif signo in {signal.SIGTERM, signal.SIGINT} and not self._stopping:
+            logger.info("Shutting down")
+            self._stopping = True
+            self._retire(self.workers)
+            self.workers = set()
+
+    def _retire(self, pids: set[int]) -> None:
+        """Ask workers to finish their in-flight requests and exit."""
+        deadline = time.monotonic() + self.config.graceful_timeout
+        for pid in pids:
+            self._retiring[pid] = deadline
+            os.kill(pid, signal.SIGTERM)
+
+    def _reap(self) -> None:
+        """Collect exited workers."""
+        while self.workers or self._retiring:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+
+            if self._retiring.pop(pid, None) is None and pid in self.workers:
+                self.workers.remove(pid)
+                logger.warning(
+                    "Worker %s exited unexpectedly with %s",
+                    pid,
+                    os.waitstatus_to_exitcode(status),
+                )
+
+    def _replace_workers(self) -> None:
+        """Replace workers that exited unexpectedly (at most once per second)."""
+        now = time.monotonic()
+        if (
+            not self._stopping
+            and len(self.workers) < self.config.workers
+            and now >= self._next_replacement
+        ):
+            self._next_replacement = now + RESPAWN_INTERVAL
+            self._spawn_workers()
+
+    def _kill_overdue(self) -> None:
+        """Kill retiring workers that didn't exit within the graceful timeout."""
+        now = time.monotonic()
+        for pid, deadline in list(self._retiring.items()):
+            if now > deadline:
+                logger.warning("Killing worker %s (graceful timeout)", pid)
+                os.kill(pid, signal.SIGKILL)
+                self._retiring[pid] = float("inf")  # Reaped like any other
+
+
+def serve(
+    config: ServingConfig,
+    app_path: str = "example.server.processor:app",
+    setup: Callable[[], Callable[[], None] | None] = lambda: None,
+) -> None:
+    """
+    Serve the app with pre-forked workers until SIGTERM (or SIGINT).
+
+    setup is called in each worker (after the fork, before importing the app) and
+    may return a function called when the worker exits.
+    """
+    Master(config, app_path, setup).run()
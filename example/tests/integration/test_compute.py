@@ -2,21 +2,38 @@
 
 import json
 
-import requests
-
-from .utils import Uuid, base_url, operation
+import pytest
+from example.server import cache
+
+from testing.fixtures import noinject
+
+from .utils import (
+    IN_PROCESS,
+    Client,
+    Uuid,
+    client,
+    inject_operation,
+    operation,
+    operations,
+    result_cache,
+    uninject_operation,
+)
 
 HTTP_OK = 200
+HTTP_PRECONDITION_FAILED = 412
+HTTP_BAD_REQUEST = 400
+MANY_OPERATIONS = ["identity", "square", "cube"] * 100
 
 
 @operation.set("identity")
-def test_compute_identity(uuid: Uuid) -> None:
+@client
+def test_compute_identity(client_: Client, uuid: Uuid) -> None:
     """Test the /compute end-point for a user with identity operation."""
     # GIVEN
     payload = {"uuid": uuid, "input": 9}
 
     # WHEN
-    response = requests.post(f"{base_url}/compute", json=payload, timeout=5)
+    response = client_.post("/compute", payload)
 
     # THEN
     assert response.status_code == HTTP_OK
@@ -26,14 +43,15 @@ def test_compute_identity(uuid: Uuid) -> None:
 
 
 @operation.set("square")
-def test_compute_square(uuid: Uuid) -> None:
+@client
+def test_compute_square(client_: Client, uuid: Uuid) -> None:
     """Test the /compute end-point for a user with square operation."""
     # GIVEN
     payload = {"uuid": uuid, "input": 9}
     expected_result = 9 * 9  # square operation
 
     # WHEN
-    response = requests.post(f"{base_url}/compute", json=payload, timeout=5)
+    response = client_.post("/compute", payload)
 
     # THEN
     assert response.status_code == HTTP_OK
@@ -43,14 +61,15 @@ def test_compute_square(uuid: Uuid) -> None:
 
 
 @operation.set("cube")
-def test_compute_cube(uuid: Uuid) -> None:
+@client
+def test_compute_cube(client_: Client, uuid: Uuid) -> None:
     """Test the /compute end-point for a user with cube operation."""
     # GIVEN
     payload = {"uuid": uuid, "input": 9}
     expected_result = 9 * 9 * 9  # cube operation
 
     # WHEN
-    response = requests.post(f"{base_url}/compute", json=payload, timeout=5)
+    response = client_.post("/compute", payload)
 
     # THEN
     assert response.status_code == HTTP_OK
@@ -60,14 +79,15 @@ def test_compute_cube(uuid: Uuid) -> None:
 
 
 # Note: No operation record in the DB
-def test_compute_no_operation() -> None:
+@client
+def test_compute_no_operation(client_: Client) -> None:
     """Test the /compute end-point for a user with no operation in the DB."""
     # GIVEN
     uuid = 7890
     payload = {"uuid": uuid, "input": 9}
 
     # WHEN
-    response = requests.post(f"{base_url}/compute", json=payload, timeout=5)
+    response = client_.post("/compute", payload)
 
     # THEN
     assert response.status_code == HTTP_OK
@@ -75,3 +95,106 @@ def test_compute_no_operation() -> None:
     output = json.loads(response.text)
     assert "error" in output
     assert str(uuid) in output["error"]["message"]
+
+
+@operations.set(MANY_OPERATIONS)
+@client
+def test_compute_many(client_: Client, uuids: list[Uuid]) -> None:
+    """Test the /compute end-point for many users seeded in bulk."""
+    # GIVEN
+    expected = {"identity": 3, "square": 3 * 3, "cube": 3 * 3 * 3}
+
+    for uuid, name in zip(uuids, MANY_OPERATIONS, strict=True):
+        # WHEN
+        response = client_.post("/compute", {"uuid": uuid, "input": 3})
+
+        # THEN
+        assert response.status_code == HTTP_OK
+
+        output = json.loads(response.text)
+        assert output["result"] == expected[name]
+
+
+@client
+def test_compute_invalid_payload(client_: Client) -> None:
+    """Test the /compute end-point rejects payloads not matching its schema."""
+    # GIVEN
+    payloads = [
+        [1, 2],
+        {"input": 9},
+        {"uuid": "7890", "input": 9},
+        {"uuid": 7890, "input": "9"},
+        {"uuid": 7890, "input": True},
+    ]
+
+    for payload in payloads:
+        # WHEN
+        response = client_.post("/compute", payload)
+
+        # THEN
+        assert response.status_code == HTTP_BAD_REQUEST
+
+        output = json.loads(response.text)
+        assert "Invalid payload" in output["error"]["message"]
+
+
+@pytest.mark.skipif(not IN_PROCESS, reason="enables the cache of the in-process app")
+@noinject(result_cache)
+@operation.set("square")
+@client
+def test_compute_cached(client_: Client, uuid: Uuid) -> None:
+    """Test repeated /compute requests are answered from the cache with an ETag."""
+    # GIVEN
+    payload = {"uuid": uuid, "input": 4}
+    first = client_.post("/compute", payload)
+    etag = first.headers["ETag"]
+
+    # WHEN
+    repeated = client_.post("/compute", payload)
+    conditional = client_.post("/compute", payload, {"If-None-Match": etag})
+
+    # THEN
+    assert first.status_code == HTTP_OK
+    assert json.loads(first.text)["result"] == 4 * 4
+    assert repeated.text == first.text
+    assert repeated.headers["ETag"] == etag
+    assert conditional.status_code == HTTP_PRECONDITION_FAILED
+    assert conditional.headers["ETag"] == etag
+    assert "result" not in json.loads(conditional.text)
+
+
+@pytest.mark.skipif(not IN_PROCESS, reason="enables the cache of the in-process app")
+@noinject(result_cache)
+@operation.set("square")
+@client
+def test_compute_cache_invalidated(client_: Client, uuid: Uuid) -> None:
+    """Test changing the operation of a uuid invalidates its cached operation."""
+    # GIVEN
+    payload = {"uuid": uuid, "input": 2}
+    client_.post("/compute", payload)
+
+    # WHEN
+    uninject_operation(uuid)
+    inject_operation(uuid, "cube")
+    response = client_.post("/compute", payload)
+
+    # THEN
+    assert json.loads(response.text)["result"] == 2 * 2 * 2
+
+
+@pytest.mark.skipif(not IN_PROCESS, reason="enables the cache of the in-process app")
+@noinject(result_cache)
+@operation.set("square")
+@client
+def test_compute_unknown_uuid_not_cached(client_: Client, uuid: Uuid) -> None:
+    """Test unknown uuids aren't cached (another process may inject them any time)."""
+    # GIVEN
+    uninject_operation(uuid)
+
+    # WHEN
+    response = client_.post("/compute", {"uuid": uuid, "input": 2})
+
+    # THEN
+    assert "Unable to find operation" in json.loads(response.text)["error"]["message"]
+    with pytest.raises(KeyError):
+        cache.operations[uuid]
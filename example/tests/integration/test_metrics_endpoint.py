@@ -0,0 +1,38 @@
+"""Test the /metrics end-point in the server."""
+
+import re
+
+from testing.fixtures import noinject
+
+from .utils import Client, Uuid, client, metrics_enabled, operation
+
+HTTP_OK = 200
+PHASES = ("decode", "db", "compute", "serialize", "total")
+PHASE_COUNT = re.compile(
+    r'^compute_phase_seconds_count\{phase="(\w+)"\} (\S+)$', re.MULTILINE
+)
+
+
+def _phase_counts(client_: Client) -> dict[str, float]:
+    """Scrape /metrics for the number of observations of each /compute phase."""
+    response = client_.get("/metrics")
+    assert response.status_code == HTTP_OK
+
+    return {phase: float(count) for phase, count in PHASE_COUNT.findall(response.text)}
+
+
+@noinject(metrics_enabled)
+@operation.set("square")
+@client
+def test_metrics_endpoint(client_: Client, uuid: Uuid) -> None:
+    """Test that /compute phases are counted in the Prometheus text format."""
+    # GIVEN
+    before = _phase_counts(client_)
+
+    # WHEN
+    client_.post("/compute", {"uuid": uuid, "input": 3})
+
+    # THEN
+    after = _phase_counts(client_)
+    for phase in PHASES:
+        assert after.get(phase, 0) >= before.get(phase, 0) + 1, phase
@@ -0,0 +1,60 @@
+"""Test the pre-forking production server."""
+
+import contextlib
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+from testing.fixtures.utils import Service, run_service
+
+from .utils import TIMEOUT
+
+HTTP_OK = 200
+WORKERS = 2
+
+PREFORK_ENV = {
+    **os.environ,
+    "SERVER_MODE": "prefork",
+    "SERVER_WORKERS": str(WORKERS),
+    "SERVER_THREADS": "2",
+    "DB_BACKEND": "memory",  # Only /test is requested
+}
+
+
+def _workers(master: subprocess.Popen[bytes]) -> set[int]:
+    """Get the pids of the (live) workers forked by master (from /proc)."""
+    workers = set()
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        with contextlib.suppress(OSError):  # Process exited meanwhile
+            # Fields after the (parenthesized) command: state, ppid, ...
+            state, ppid = stat.read_text().rsplit(")", 1)[1].split()[:2]
+            if int(ppid) == master.pid and state != "Z":
+                workers.add(int(stat.parent.name))
+
+    return workers
+
+
+@run_service.set(
+    [sys.executable, "-m", "example.server"], ready_path="/test", env=PREFORK_ENV
+)
+def test_prefork_reload(service: Service) -> None:
+    """Workers are replaced on SIGHUP while the server keeps serving."""
+    # GIVEN
+    old = _workers(service.process)
+
+    # WHEN
+    service.process.send_signal(signal.SIGHUP)
+
+    # THEN
+    deadline = time.monotonic() + TIMEOUT
+    while (new := _workers(service.process)) & old or len(new) < WORKERS:
+        assert time.monotonic() < deadline, f"workers {old} not replaced: {new}"
+        time.sleep(0.05)
+
+    response = requests.get(f"{service.url}/test", timeout=TIMEOUT)
+    assert response.status_code == HTTP_OK
@@ -2,20 +2,19 @@
 
 import json
 
-import requests
-
-from .utils import base_url
+from .utils import Client, client
 
 HTTP_OK = 200
 
 
-def test_test_endpoint() -> None:
+@client
+def test_test_endpoint(client_: Client) -> None:
     """Test the /test end-point in the server."""
     # GIVEN
-    url = f"{base_url}/test"
+    path = "/test"
 
     # WHEN
-    response = requests.get(url, timeout=5)
+    response = client_.get(path)
 
     # THEN
     assert response.status_code == HTTP_OK
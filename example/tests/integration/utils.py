@@ -1,56 +1,325 @@
 """Utilities for testing such as shared constants and fixtures."""
 
-from typing import NewType, ParamSpec
+import hashlib
+import itertools
+import os
+import secrets
+import sys
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NewType, ParamSpec, Protocol
 
-from example.server import dba
+import requests
+from example.server import cache, dba, metrics
+from example.server.processor import app
+from psycopg import sql
+from requests.adapters import HTTPAdapter
 
-from testing.fixtures import FixtureDefinition, fixture
+from testing.fixtures import FixtureDefinition, compose, compose_noinject, fixture
+from testing.fixtures.utils import Service, run_service
 
 P = ParamSpec("P")
 Uuid = NewType("Uuid", int)
 
-UUID: Uuid = Uuid(1234)
-base_url = "http://server"
+# Each process allocates uuids from its own randomly chosen block so that concurrent
+# test runs against the same DB don't clash (the table requires unique uuids).
+# Block 0 is skipped since it holds the small uuids used by tests as "unknown".
+UUID_BLOCK_SIZE = 2**16
+_uuid_block = (secrets.randbelow(2**14 - 1) + 1) * UUID_BLOCK_SIZE
+_uuid_counter = itertools.count()
 
+base_url = os.environ.get("BASE_URL", "http://server")
+TIMEOUT = 5
+POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", "10"))
+
+# When IN_PROCESS is set the flask app is driven in-process via its test client
+# (instead of over HTTP) and DB_BACKEND defaults to the in-memory backend.
+# This allows the suite to run without the composable environment.
+# Set DB_BACKEND=postgres to run in-process against the real DB.
+IN_PROCESS = os.environ.get("IN_PROCESS", "") not in {"", "0"}
+
+DB_BACKEND = os.environ.get("DB_BACKEND", "memory") if IN_PROCESS else "postgres"
+
+# With SPAWN_SERVER set the tests launch the server themselves (as a subprocess on an
+# ephemeral port, shared by the session) instead of using the one at BASE_URL
+SPAWN_SERVER = not IN_PROCESS and os.environ.get("SPAWN_SERVER", "") not in {"", "0"}
+
+if IN_PROCESS:
+    dba.set_backend(dba.create_backend(DB_BACKEND))
+
+# In-process runs against postgres give each xdist worker its own clone of a template
+# database so tests can run fully parallel (a remote server only uses its own DB)
+CLONE_DATABASES = IN_PROCESS and DB_BACKEND == "postgres"
+SCHEMA_PATH = Path(__file__).parents[2] / "database" / "operations.sql"
+WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEMPLATE_LOCK = 0x0F1C5  # Advisory lock serializing creation of the template
+
+
+@dataclass
+class Reply:
+    """Transport independent response from the server."""
+
+    status_code: int
+    text: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+class Client(Protocol):
+    """Issues requests to the server."""
+
+    def get(self, path: str) -> Reply:
+        """Send GET request to path."""
+
+    def post(
+        self,
+        path: str,
+        payload: Any,  # noqa: ANN401
+        headers: Mapping[str, str] | None = None,
+    ) -> Reply:
+        """Send POST request with JSON payload (and extra headers) to path."""
+
+
+class RemoteClient:
+    """Client talking to the server over HTTP (reusing pooled connections)."""
+
+    def __init__(self, url: str, session: requests.Session) -> None:
+        """Create client for server at url sending requests through session."""
+        self._url = url
+        self._session = session
+
+    def get(self, path: str) -> Reply:
+        """Send GET request to path."""
+        response = self._session.get(f"{self._url}{path}", timeout=TIMEOUT)
+        return Reply(response.status_code, response.text, response.headers)
+
+    def post(
+        self,
+        path: str,
+        payload: Any,  # noqa: ANN401
+        headers: Mapping[str, str] | None = None,
+    ) -> Reply:
+        """Send POST request with JSON payload (and extra headers) to path."""
+        response = self._session.post(
+            f"{self._url}{path}", json=payload, headers=headers, timeout=TIMEOUT
+        )
+        return Reply(response.status_code, response.text, response.headers)
+
+
+class InProcessClient:
+    """Client driving the flask app in-process via its test client."""
+
+    def __init__(self) -> None:
+        """Create client around the flask test client."""
+        self._client = app.test_client()
+
+    def get(self, path: str) -> Reply:
+        """Send GET request to path."""
+        response = self._client.get(path)
+        return Reply(response.status_code, response.text, dict(response.headers))
+
+    def post(
+        self,
+        path: str,
+        payload: Any,  # noqa: ANN401
+        headers: Mapping[str, str] | None = None,
+    ) -> Reply:
+        """Send POST request with JSON payload (and extra headers) to path."""
+        response = self._client.post(path, json=payload, headers=headers)
+        return Reply(response.status_code, response.text, dict(response.headers))
+
+
+@fixture(scope="session")
+def http_session(pool_size: int = POOL_SIZE) -> FixtureDefinition[requests.Session]:
+    """
+    Session scoped HTTP session with a keep-alive connection pool.
+
+    Shared by all tests so that connections to the server are set up once rather
+    than per request.
+    The pool size can be tuned via HTTP_POOL_SIZE or http_session.set(pool_size).
+    """
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        yield session
+
+
+@fixture(scope="session")
+@compose(run_service.set([sys.executable, "-m", "example.server"], ready_path="/test"))
+def spawned_server(service: Service) -> FixtureDefinition[str]:
+    """Launch the server as a subprocess (once per session) and yield its URL."""
+    yield service.url
+
+
+@fixture(scope="session")
+def configured_server() -> FixtureDefinition[str]:
+    """Yield the URL of the already running server (BASE_URL)."""
+    yield base_url
+
+
+# Fixture yielding the URL of the server the remote client talks to
+server_url = spawned_server if SPAWN_SERVER else configured_server
+
+
+@fixture
+@compose(server_url)
+@compose(http_session)
+def client(session: requests.Session, url: str) -> FixtureDefinition[Client]:
+    """Inject client for the server (in-process or remote depending on IN_PROCESS)."""
+    if IN_PROCESS:
+        yield InProcessClient()
+    else:
+        yield RemoteClient(url, session)
+
+
+@fixture
+def metrics_enabled() -> FixtureDefinition[None]:
+    """Enable metrics collection (in-process) for the duration of the test."""
+    previous = metrics.enabled
+    metrics.set_enabled(True)
+
+    try:
+        yield
+
+    finally:
+        metrics.set_enabled(previous)
+
+
+@fixture
+def result_cache(size: int = 128) -> FixtureDefinition[None]:
+    """Enable the (in-process) /compute result cache for the duration of the test."""
+    cache.configure(size)
+
+    try:
+        yield
+
+    finally:
+        cache.configure()
+
+
+@fixture(scope="session")
+def template_database() -> FixtureDefinition[str]:
+    """
+    Create (once) a template database with the schema applied and yield its name.
+
+    The name carries a hash of the schema so a changed schema gets a new template.
+    It is left in place for later runs; concurrent workers wait on an advisory lock
+    while the first one creates it.
+    """
+    schema = SCHEMA_PATH.read_text(encoding="utf-8")
+    name = f"operations_template_{hashlib.sha256(schema.encode()).hexdigest()[:12]}"
 
-def inject_operation(uuid: Uuid, operation_name: str) -> None:
-    """Inject specified uuid and operation into DB."""
     with dba.get_cursor(autocommit=True) as cursor:
-        query = """
-            INSERT
-                INTO operations
-                (
-                    uuid,
-                    operation
+        cursor.execute("SELECT pg_advisory_lock(%s)", (TEMPLATE_LOCK,))
+        try:
+            cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,))
+            if cursor.fetchone() is None:
+                cursor.execute(
+                    sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name))
                 )
-            VALUES
-                (
-                    %(uuid)s,
-                    %(operation)s
+                with dba.get_cursor(autocommit=True, dbname=name) as template:
+                    template.execute(schema.encode())
+                cursor.execute(
+                    sql.SQL("ALTER DATABASE {} IS_TEMPLATE true").format(
+                        sql.Identifier(name)
+                    )
                 )
-        """
-        cursor.execute(query, {"uuid": uuid, "operation": operation_name})
+        finally:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (TEMPLATE_LOCK,))
+
+    yield name
+
+
+@fixture(scope="session")
+@compose(template_database)
+def database(template: str) -> FixtureDefinition[str]:
+    """
+    Clone the template database for this worker and point dba at it.
+
+    Yields the name of the clone, which is dropped again at the end of the session.
+    """
+    name = f"operations_{WORKER}_{os.getpid()}"
+    create = sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+        sql.Identifier(name), sql.Identifier(template)
+    )
+    drop = sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(
+        sql.Identifier(name)
+    )
+
+    with dba.get_cursor(autocommit=True) as cursor:
+        cursor.execute(create)
+
+    previous = dba.set_database(name)
+    try:
+        yield name
+
+    finally:
+        dba.set_database(previous)
+        with dba.get_cursor(autocommit=True) as cursor:
+            cursor.execute(drop)
+
+
+@fixture(scope="session")
+def no_database() -> FixtureDefinition[str]:
+    """Use the database the backend is configured with (nothing to set up)."""
+    yield dba.DB_NAME
+
+
+# Fixture giving each worker an isolated database (where possible)
+isolated_database = database if CLONE_DATABASES else no_database
+
+
+def new_uuids(count: int) -> list[Uuid]:
+    """Allocate count uuids unique to this process (and test)."""
+    uuids = [Uuid(_uuid_block + next(_uuid_counter)) for _ in range(count)]
+
+    if uuids and uuids[-1] >= _uuid_block + UUID_BLOCK_SIZE:
+        err_msg = f"Exhausted uuid block of size {UUID_BLOCK_SIZE}"
+        raise RuntimeError(err_msg)
+
+    return uuids
+
+
+def inject_operation(uuid: Uuid, operation_name: str) -> None:
+    """Inject specified uuid and operation into DB."""
+    dba.inject_operation(uuid, operation_name)
 
 
 def uninject_operation(uuid: Uuid) -> None:
     """Remove injected operation from DB."""
-    with dba.get_cursor(autocommit=True) as cursor:
-        query = """
-            DELETE
-                FROM operations
-            WHERE
-                uuid=%(uuid)s
-        """
-        cursor.execute(query, {"uuid": uuid})
+    dba.uninject_operation(uuid)
 
 
 @fixture
+@compose_noinject(isolated_database)
 def operation(operation_name: str) -> FixtureDefinition[Uuid]:
     """Tunable fixture that injects specified operation_name into DB and yield uuid."""
+    (uuid,) = new_uuids(1)
+
     try:
-        inject_operation(UUID, operation_name)
+        inject_operation(uuid, operation_name)
+
+        yield uuid
+
+    finally:
+        uninject_operation(uuid)
 
-        yield UUID
+
+@fixture
+@compose_noinject(isolated_database)
+def operations(operation_names: Sequence[str]) -> FixtureDefinition[list[Uuid]]:
+    """
+    Tunable fixture that injects one row per operation_name and yields their uuids.
+
+    All rows are inserted in a single round trip and removed in a single DELETE.
+    """
+    uuids = new_uuids(len(operation_names))
+
+    dba.inject_operations(zip(uuids, operation_names, strict=True))
+    try:
+        yield uuids
 
     finally:
-        uninject_operation(UUID)
+        dba.uninject_operations(uuids)
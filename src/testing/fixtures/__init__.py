@@ -1,18 +1,34 @@
 """Implementation of new fixtures module."""
 
+import atexit
 import inspect
-from collections.abc import Callable, Generator
+import time
+import warnings
+from collections.abc import Callable, Generator, Iterator, Sequence
+from concurrent.futures import Executor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from functools import partial, wraps
 from types import FunctionType, TracebackType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Concatenate,
     Generic,
+    Literal,
+    NamedTuple,
     TypeVar,
+    cast,
+    overload,
 )
 
 from typing_extensions import ParamSpec, Self
 
+from . import integrity, leaks, teardown
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 D = ParamSpec("D")  # Parameters injected into fixture definition
 T = ParamSpec("T")  # Test function parameters
 Y = TypeVar("Y")  # Type of value yielded by fixture generator to be injected into test
@@ -21,6 +37,111 @@ Y = TypeVar("Y")  # Type of value yielded by fixture generator to be injected in
 # throwing exceptions to the yield statement
 FixtureDefinition = Generator[Y, None, None]
 
+# "function": setup and teardown run around every test (the default)
+# "session": the value is kept alive after a test and reused by subsequent tests that
+#            set the same (kw)args. Teardown runs at the end of the session (or when
+#            the (kw)args change).
+Scope = Literal["function", "session"]
+
+
+class Binding(NamedTuple):
+    """A fixture applied to a test (or composed into a definition) with its (kw)args."""
+
+    fixture: "Fixture[Any, Any]"
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    lazy: bool = False  # Only set up if the test accesses the value (see lazy())
+    matrix: "Matrix | None" = None  # Cells the test is run for (see Fixture.matrix())
+
+    def describe(self) -> str:
+        """Describe the binding as a readable call e.g. operation('square')."""
+        params = [repr(arg) for arg in self.args]
+        params += [f"{key}={value!r}" for key, value in self.kwargs.items()]
+        name = getattr(self.fixture.definition, "__name__", "fixture")
+
+        return f"{name}({', '.join(params)})"
+
+
+class Observer:
+    """
+    Base class for instrumentation notified around fixture setup and teardown.
+
+    Subclasses override the methods they need and are registered via add_observer().
+    The binding carries the (kw)args the fixture was set up with.
+    Teardowns of deferred fixtures are notified from the teardown worker thread.
+    """
+
+    def setup_started(self, binding: Binding) -> None:
+        """Call before the setup (pre-yield part) of a fixture runs."""
+
+    def setup_finished(self, binding: Binding) -> None:
+        """Call after the setup of a fixture has run (even if it raised)."""
+
+    def teardown_started(self, binding: Binding) -> None:
+        """Call before the teardown (post-yield part) of a fixture runs."""
+
+    def teardown_finished(self, binding: Binding) -> None:
+        """Call after the teardown of a fixture has run (even if it raised)."""
+
+
+_observers: list[Observer] = []
+
+
+def add_observer(observer: Observer) -> None:
+    """Register observer to be notified around fixture setup and teardown."""
+    _observers.append(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """Unregister observer."""
+    _observers.remove(observer)
+
+
+@contextmanager
+def _observe(
+    phase: Literal["setup", "teardown"], binding: Binding | None
+) -> Iterator[None]:
+    """Notify observers around a phase (setup or teardown) of a fixture."""
+    if not _observers or binding is None:
+        yield
+        return
+
+    for observer in _observers:
+        getattr(observer, f"{phase}_started")(binding)
+    try:
+        yield
+    finally:
+        for observer in _observers:
+            getattr(observer, f"{phase}_finished")(binding)
+
+
+def get_bindings(function: Callable[..., Any]) -> tuple[Binding, ...]:
+    """
+    Get the fixtures bound to a decorated test or composed fixture definition.
+
+    Ordered from the outermost decorator inwards.
+    This lets tooling (e.g. the pytest plugin) inspect fixture usage at collection.
+    """
+    return getattr(function, "_fixture_bindings", ())
+
+
+def get_matrix(function: Callable[..., Any]) -> "Matrix | None":
+    """Get the matrix of a test decorated with Fixture.matrix() (else None)."""
+    return next(
+        (binding.matrix for binding in get_bindings(function) if binding.matrix),
+        None,
+    )
+
+
+def _bind(
+    inner: Callable[..., Any], wrapped: Callable[..., Any], binding: Binding
+) -> None:
+    """Record binding on inner on top of the bindings already on wrapped."""
+    inner._fixture_bindings = (  # type: ignore[attr-defined]  # noqa: SLF001
+        binding,
+        *get_bindings(wrapped),
+    )
+
 
 def preserve_metadata(
     original: Callable[..., Any], noinject: bool = False
@@ -96,6 +217,60 @@ def preserve_metadata(
     return decorator
 
 
+@dataclass(frozen=True)
+class FailFast:
+    """Policy for remembering (and retrying) setup failures of a fixture."""
+
+    ttl: float | None = None  # Seconds a failure is remembered (None: until exit)
+    retries: int = 0  # Extra setup attempts before a failure is remembered
+    backoff: float = 0.1  # Seconds before the first retry (doubling after each)
+
+
+class SetupFailure(NamedTuple):
+    """A setup failure remembered for the (kw)args it happened with."""
+
+    key: tuple[tuple[Any, ...], dict[str, Any]]
+    error: Exception
+    traceback: TracebackType | None
+    expires: float | None  # time.monotonic() after which the failure is forgotten
+
+
+def _start_generator(generator: FixtureDefinition[Y]) -> Y:
+    """Run the setup (pre-yield part) of a fixture definition."""
+    try:
+        return next(generator)
+    except StopIteration:
+        err_msg = "generator did not yield"
+        raise RuntimeError(err_msg) from None
+
+
+def _finish_generator(
+    generator: FixtureDefinition[Any], binding: Binding | None = None
+) -> None:
+    """Run the teardown (post-yield part) of a fixture definition."""
+    with _observe("teardown", binding):
+        try:
+            next(generator)
+        except StopIteration:
+            pass
+        else:
+            err_msg = "generator did not stop"
+            raise RuntimeError(err_msg)
+
+
+def _finish_deferred(
+    generator: FixtureDefinition[Any],
+    binding: Binding | None,
+    track: Callable[[], None] | None,
+) -> None:
+    """Run a deferred teardown and then watch the value for leaks (if track)."""
+    try:
+        _finish_generator(generator, binding)
+    finally:
+        if track is not None:
+            track()
+
+
 class Fixture(Generic[Y, D]):
     """
     Instances of this class function both as a context manager and a decorator.
@@ -123,9 +298,40 @@ class Fixture(Generic[Y, D]):
     Since a Fixture instance can be used by multiple tests AND composed with multiple
     other fixture definitions the definition args and kwargs are cached at
     various levels by mostly being closed over.
+
+    A session scoped Fixture does not run its teardown on the last exit.
+    The live value is reused by the next entry with the same (kw)args and is only
+    torn down by close() (called for all session fixtures at interpreter exit).
+
+    A deferred Fixture queues the teardown after the last exit to a background worker
+    (see testing.fixtures.teardown) so that the next test can start right away.
+    Teardown after an exception is always synchronous.
+    With barrier=True the next entry first waits for the pending teardown to finish.
+
+    With a fail_fast policy a setup failure (after retrying with backoff) is remembered
+    for the (kw)args and re-raised straight away by the following entries (until the
+    policy's ttl expires) rather than paying for (e.g. timing out in) the setup again.
+
+    With guard=True the value is fingerprinted after the setup and checked on every
+    exit, failing the test that mutated it (see testing.fixtures.integrity).
+
+    Fixtures whose setup touches process wide state (e.g. the cwd) must be created with
+    global_state=True which excludes them from being prefetched (see prefetch()).
+    Deferred fixtures can't compose other fixtures since their exits (and hence
+    reentrance counts) would then be updated from the worker thread.
     """
 
-    def __init__(self, generator_func: Callable[D, FixtureDefinition[Y]]) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        generator_func: Callable[D, FixtureDefinition[Y]],
+        *,
+        scope: Scope = "function",
+        deferred: bool = False,
+        barrier: bool = False,
+        global_state: bool = False,
+        fail_fast: FailFast | None = None,
+        guard: bool = False,
+    ) -> None:
         """
         Create a Fixture object.
 
@@ -135,6 +341,20 @@ class Fixture(Generic[Y, D]):
         self._func = generator_func
         self._generator: FixtureDefinition[Y]  # Declare here for pylint. Assigned later
         self._value: Y
+        self._binding: Binding  # (kw)args the live generator was set up with
+        self.scope = scope
+        self.deferred = deferred
+        self.barrier = barrier
+        self.global_state = global_state  # Setup touches process wide state
+        self.fail_fast = fail_fast
+        self._failures: list[SetupFailure] = []
+        self.guard = guard
+        self._fingerprint: bytes | None = None  # Of the live value (when guarded)
+        self.example_reset_hook: Callable[[Y], None] | None = None
+        self._pending_teardown: Future[None] | None = None
+        self._prefetched: (
+            tuple[tuple[tuple[Any, ...], dict[str, Any]], Future[tuple[Any, Y]]] | None
+        ) = None
 
         # Default values for fixture definition args and kwargs
         self.args: tuple[Any, ...] = ()
@@ -142,6 +362,24 @@ class Fixture(Generic[Y, D]):
 
         self._entries = 0  # Keep track of reentrance
 
+        # (kw)args of the live generator of a session scoped fixture between tests
+        self._live_key: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+        if deferred and get_bindings(generator_func):
+            err_msg = (
+                f"Fixture {generator_func.__name__} composes other fixtures "
+                "so its teardown can't be deferred"
+            )
+            raise ValueError(err_msg)
+
+        if scope == "session":
+            _session_fixtures.append(self)
+
+    @property
+    def definition(self) -> Callable[D, FixtureDefinition[Y]]:
+        """The fixture definition (generator function) wrapped by this Fixture."""
+        return self._func
+
     def set(self, *d_args: D.args, **d_kwargs: D.kwargs) -> Self:
         """Set the args and kwargs passed down to the fixture definition."""
         self.args = d_args
@@ -149,6 +387,16 @@ class Fixture(Generic[Y, D]):
 
         return self
 
+    def example_reset(self, hook: Callable[[Y], None]) -> Callable[[Y], None]:
+        """
+        Declare (decorator) hook restoring the value between Hypothesis examples.
+
+        It lets the value be reused across examples rather than torn down and set up
+        for each one (see testing.fixtures.hypothesis).
+        """
+        self.example_reset_hook = hook
+        return hook
+
     def reset(self) -> None:
         """Reset the fixture definition args and kwargs."""
         self.args = ()
@@ -159,11 +407,48 @@ class Fixture(Generic[Y, D]):
         self._entries += 1
 
         if self._entries == 1:  # First entry
+            if self._live_key is not None:
+                if self._live_key == (self.args, self.kwargs):
+                    return self._value
+
+                # The (kw)args have changed so the live value can't be reused
+                self.close()
+
+            if self.barrier and self._pending_teardown is not None:
+                # Errors are collected by the teardown module so this never raises
+                self._pending_teardown.result()
+                self._pending_teardown = None
+
+            binding = Binding(self, self.args, self.kwargs)
+            with _observe("setup", binding):
+                try:
+                    if not self._take_prefetched():
+                        self._setup()
+                except BaseException:
+                    # __exit__ is not called when __enter__ raises
+                    self._entries = 0
+                    raise
+
+            self._binding = binding
+            if self.guard or integrity.enabled:
+                self._fingerprint = integrity.fingerprint(self._value)
+
+        return self._value
+
+    def _setup(self) -> None:
+        """Run the setup (pre-yield part) of the fixture definition."""
+        policy = self.fail_fast
+        if policy is not None:
+            self._raise_remembered_failure()
+
+        retries = policy.retries if policy is not None else 0
+        for attempt in range(retries + 1):
             try:
                 self._generator = self._func(*self.args, **self.kwargs)
             except TypeError:
-                # This indicates that the order of re-entry is invalid causing incorrect
-                # (kw)args to be passed in (usually the default/reset empty values)
+                # This indicates that the order of re-entry is invalid causing
+                # incorrect (kw)args to be passed in (usually the default/reset empty
+                # values)
                 # Reset the (kw)args to be sure
                 # Reset the entry count so that the next usage of the fixture (in a
                 # test) works properly
@@ -173,46 +458,227 @@ class Fixture(Generic[Y, D]):
                 raise
 
             try:
-                self._value = next(self._generator)
+                self._value = _start_generator(self._generator)
+            except Exception as exc:
+                if policy is None:
+                    raise
+                if attempt == retries:
+                    self._remember_failure(exc, policy)
+                    raise
+
+                time.sleep(policy.backoff * 2**attempt)
+            else:
+                return
+
+    def _raise_remembered_failure(self) -> None:
+        """Re-raise the unexpired setup failure for the current (kw)args (if any)."""
+        now = time.monotonic()
+        self._failures = [
+            failure
+            for failure in self._failures
+            if failure.expires is None or failure.expires > now
+        ]
+
+        for failure in self._failures:
+            if failure.key == (self.args, self.kwargs):
+                # Start from the original traceback rather than growing it every time
+                raise failure.error.with_traceback(failure.traceback)
+
+    def _remember_failure(self, error: Exception, policy: FailFast) -> None:
+        """Remember the setup failure for the current (kw)args."""
+        expires = None if policy.ttl is None else time.monotonic() + policy.ttl
+        self._failures.append(
+            SetupFailure((self.args, self.kwargs), error, error.__traceback__, expires)
+        )
 
-            except StopIteration:
-                err_msg = "generator did not yield"
-                raise RuntimeError(err_msg) from None
+    def prefetch(self, executor: Executor) -> None:
+        """
+        Start the setup with the currently set (kw)args on executor.
 
-            else:
-                return self._value
+        The next first entry with the same (kw)args takes over the value instead of
+        running the setup itself (falling back to it if the prefetch failed).
+        Must not be used for fixtures touching global state (e.g. the cwd) or
+        composing other fixtures since the setup runs concurrently with other code.
+        With barrier=True the setup first waits for the pending teardown to finish.
+        """
+        key = (self.args, self.kwargs)
+        self.reset()
 
-        else:
-            return self._value
+        if self._prefetched is not None:
+            return
+
+        pending = self._pending_teardown if self.barrier else None
+
+        def _run() -> tuple[FixtureDefinition[Y], Y]:
+            """Set up in the background."""
+            if pending is not None:
+                pending.result()  # Never raises (see __enter__)
+
+            generator = self._func(*key[0], **key[1])
+            return generator, _start_generator(generator)
+
+        self._prefetched = (key, executor.submit(_run))
+
+    def discard_prefetch(self) -> None:
+        """Tear down a prefetched value that was never taken over."""
+        if self._prefetched is None:
+            return
+
+        _, future = self._prefetched
+        self._prefetched = None
+
+        try:
+            generator, _ = future.result()
+        except Exception:  # noqa: BLE001  # Setup failed so there is nothing to tear down
+            return
+
+        _finish_generator(generator)
+
+    def _take_prefetched(self) -> bool:
+        """Take over the prefetched value if it was set up with the current (kw)args."""
+        if self._prefetched is None:
+            return False
+
+        key, future = self._prefetched
+        if key != (self.args, self.kwargs):
+            self.discard_prefetch()
+            return False
+
+        self._prefetched = None
+        try:
+            self._generator, self._value = future.result()
+        except Exception:  # noqa: BLE001  # Fall back to the synchronous setup
+            return False
+
+        return True
+
+    def close(self) -> None:
+        """Tear down the live value kept alive between tests by a session scope."""
+        if self._live_key is None:
+            return
+
+        self._live_key = None
+        self._finish()
+
+    def _keep_alive(self) -> bool:
+        """Keep the value of a session scoped fixture alive after the last exit."""
+        # Keyed by the (kw)args of the setup (reentries may have set others since)
+        self._live_key = (self._binding.args, self._binding.kwargs)
+        self.reset()
+        return False
 
     def _exit_no_exception(self) -> bool:
         """Handle exit when no exception was raised."""
+        if self._entries == 0 and self.scope == "session":
+            return self._keep_alive()
+
+        if self._entries == 0 and self.deferred:
+            # The generator refers to the value until the teardown has run
+            track = (
+                leaks.track_later(self._func.__name__, self._value)
+                if leaks.enabled
+                else None
+            )
+            self._pending_teardown = teardown.submit(
+                self._func.__name__,
+                partial(_finish_deferred, self._generator, self._binding, track),
+            )
+            self.reset()
+            self._release(track=False)
+            return False
+
         if self._entries == 0:  # Last exit (in reentrance) so finish up generator
+            self._finish()
+
+            # Now that we are done with the fixture context manager we reset it
+            self.reset()
+
+        return False
+
+    def _finish(self) -> None:
+        """Run the teardown (post-yield part) and release the value."""
+        # Observed including the release so retained memory excludes the value
+        with _observe("teardown", self._binding):
             try:
-                next(self._generator)
-            except StopIteration:
-                # Now that we are done with the fixture context manager we reset it
-                self.reset()
-                return False
-            else:
-                err_msg = "generator did not stop"
-                raise RuntimeError(err_msg)
-        else:
-            return False
+                _finish_generator(self._generator)
+            finally:
+                self._release()
+
+    def _release(self, track: bool = True) -> None:
+        """
+        Drop the references to the value and generator after the last exit.
+
+        Otherwise (since fixtures are usually module globals) a large value would stay
+        alive until the next use of the fixture.
+        With track the value is watched for leaks (if enabled).
+        """
+        value = self.__dict__.pop("_value", None)
+        self.__dict__.pop("_generator", None)
+        self.__dict__.pop("_binding", None)
+        self._fingerprint = None
+
+        if track and leaks.enabled and value is not None:
+            leaks.track(self._func.__name__, value)
 
-    def __exit__(  # pylint: disable=R0912
+    def __exit__(
         self,
         typ: type[BaseException] | None,
         value: BaseException | None,
         traceback: TracebackType | None,
     ) -> bool:
-        """Handle exception raised within context manager."""
+        """Handle exit from the context manager (releasing value after the last)."""
         self._entries -= 1
 
+        mutated = self._check_integrity()
+        if mutated is None:
+            return self._exit(typ, value)
+
+        # Torn down as if the test had raised (and a session scoped value isn't passed
+        # on to the next test), then the test fails unless it raised already
+        suppress = self._exit(typ or type(mutated), value or mutated)
+        if self._entries == 0:
+            self.close()
         if typ is None:
+            raise mutated
+
+        return suppress
+
+    def _check_integrity(self) -> integrity.FixtureMutatedError | None:
+        """Get the error to raise if the guarded value was mutated since the setup."""
+        if self._fingerprint is None:
+            return None
+
+        if integrity.fingerprint(self._value) == self._fingerprint:
+            return None
+
+        err_msg = (
+            f"Value of fixture {self._binding.describe()} was mutated by the test "
+            "(it must not change since it is shared)"
+        )
+        return integrity.FixtureMutatedError(err_msg)
+
+    def _exit(
+        self, typ: type[BaseException] | None, value: BaseException | None
+    ) -> bool:
+        """Handle exit (after updating the reentrance count)."""
+        # A failing test must not tear down the value of a session scoped fixture
+        # which is shared with other tests
+        if typ is None or self.scope == "session":
             return self._exit_no_exception()
 
-        # An exception has been raised
+        if self._entries != 0:
+            return self._exit_with_exception(typ, value)
+
+        with _observe("teardown", self._binding):
+            try:
+                return self._exit_with_exception(typ, value)
+            finally:
+                self._release()
+
+    def _exit_with_exception(  # pylint: disable=R0912
+        self, typ: type[BaseException], value: BaseException | None
+    ) -> bool:
+        """Handle exception raised within context manager."""
         if value is None:
             # Need to force instantiation so we can reliably
             # tell if we get the same exception back
@@ -281,22 +747,213 @@ class Fixture(Generic[Y, D]):
             with self as fg_value:
                 return test_function(fg_value, *t_args, **t_kwargs)
 
+        _bind(_inner, test_function, Binding(self, fixture_args, fixture_kwargs))
+
         return _inner
 
+    def matrix(
+        self,
+        arg_sets: Sequence[tuple[Any, ...] | dict[str, Any]],
+        ids: Sequence[str] | None = None,
+        parallel: bool = False,
+    ) -> Callable[[Callable[Concatenate[Y, T], None]], Callable[T, None]]:
+        """
+        Decorate a test to run once per set of (kw)args (a cell of the matrix).
+
+        Each entry of arg_sets is either a tuple of args or a dict of kwargs.
+        The pytest plugin generates one test item per cell (with ids derived from the
+        (kw)args unless given).
+        Fixtures composed into this fixture's definition are shared: they are set up
+        on the first cell and kept alive until the last one (or a failing cell), and
+        the cells are marked to run on the same xdist worker.
+        With parallel=True nothing is shared and cells can be spread across workers.
+        """
+        cells = [
+            (arg_set, {}) if isinstance(arg_set, tuple) else ((), dict(arg_set))
+            for arg_set in arg_sets
+        ]
+        matrix = Matrix(
+            cells=cells,
+            ids=list(ids) if ids is not None else [_cell_id(*cell) for cell in cells],
+            parallel=parallel,
+            shared=() if parallel else get_bindings(self._func),
+        )
+
+        def _decorator(
+            test_function: Callable[Concatenate[Y, T], None],
+        ) -> Callable[T, None]:
+            """Decorate test to take the matrix cell (to be parametrized)."""
+            if any(binding.matrix for binding in get_bindings(test_function)):
+                err_msg = "A test can only be decorated with a single matrix"
+                raise ValueError(err_msg)
+
+            @preserve_metadata(test_function)
+            def _inner(*t_args: T.args, **t_kwargs: T.kwargs) -> None:
+                """Run test for the cell passed in by the plugin."""
+                args, kwargs = cells[cast("int", t_kwargs.pop(MATRIX_CELL))]
+                matrix.enter_shared()
+
+                try:
+                    self.set(*args, **kwargs)
+                    with self as fg_value:
+                        test_function(fg_value, *t_args, **t_kwargs)
+                except BaseException:
+                    # The failure may have torn down the shared fixtures
+                    matrix.close()
+                    raise
+                finally:
+                    matrix.release()
+
+            # Expose the cell as a parameter for pytest to parametrize
+            signature = inspect.signature(_inner)
+            cell = inspect.Parameter(MATRIX_CELL, inspect.Parameter.KEYWORD_ONLY)
+            _inner.__signature__ = signature.replace(  # type: ignore[attr-defined]
+                parameters=[*signature.parameters.values(), cell]
+            )
+
+            _bind(_inner, test_function, Binding(self, (), {}, matrix=matrix))
+
+            return _inner
+
+        return _decorator
+
     def __del__(self) -> None:
-        """Validate usage on garbage collection."""
+        """Validate usage on garbage collection (warning since GC can't raise)."""
         if self._entries != 0:
-            err_msg = (
+            warn_msg = (
                 f"Fixture {self._func.__name__} destroyed while "
                 "all reentries were not exited"
             )
-            raise RuntimeError(err_msg)
+            warnings.warn(warn_msg, ResourceWarning, stacklevel=1)
+
+
+# Name of the (keyword) parameter through which the matrix cell is passed into tests
+MATRIX_CELL = "fixture_matrix_cell"
+
+
+def _cell_id(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Derive test id for a matrix cell from its (kw)args."""
+    params = [str(arg) for arg in args]
+    params += [f"{key}={value}" for key, value in kwargs.items()]
+
+    return "-".join(params)
+
+
+@dataclass
+class Matrix:
+    """Cells of a matrix test along with the composed fixtures shared by them."""
+
+    cells: list[tuple[tuple[Any, ...], dict[str, Any]]]
+    ids: list[str]
+    parallel: bool
+    shared: tuple[Binding, ...]
+    _stack: ExitStack | None = None
+    _remaining: int | None = None  # Number of cells yet to run
+
+    def enter_shared(self) -> None:
+        """Enter the shared fixtures (unless already entered)."""
+        if self._remaining is None:
+            self._remaining = len(self.cells)
+
+        if self._stack is not None:
+            return
+
+        self._stack = ExitStack()
+        _open_matrices.append(self)
+
+        for binding in self.shared:
+            # Already entered (by an outer decorator of the test) so it must not be
+            # held across cells since its (kw)args are set by that decorator
+            if binding.fixture._entries:  # noqa: SLF001
+                continue
+
+            binding.fixture.set(*binding.args, **binding.kwargs)
+            self._stack.enter_context(binding.fixture)
+
+    def release(self) -> None:
+        """Mark a cell as done closing the shared fixtures after the last one."""
+        if self._remaining is not None:
+            self._remaining -= 1
+
+            if self._remaining == 0:
+                self.finish()
+
+    def finish(self) -> None:
+        """Close the shared fixtures as no more cells will run (e.g. deselected)."""
+        self._remaining = None
+        self.close()
+
+    def close(self) -> None:
+        """Exit the shared fixtures."""
+        if self._stack is not None:
+            stack, self._stack = self._stack, None
+            _open_matrices.remove(self)
+            stack.close()
 
 
-# We declare 'fixture' to be an alias for the Fixture class
-# When applied as a decorator to a fixture definition it creates the corresponding
-# instance of the Fixture class
-fixture = Fixture
+_session_fixtures: list[Fixture[Any, Any]] = []
+_open_matrices: list[Matrix] = []
+
+
+@atexit.register
+def close_session_fixtures() -> None:
+    """Tear down session scoped fixtures and fixtures shared by matrix cells."""
+    while _open_matrices:
+        _open_matrices[-1].close()
+
+    for fixture_ in reversed(_session_fixtures):
+        fixture_.close()
+
+
+@overload
+def fixture(generator_func: Callable[D, FixtureDefinition[Y]], /) -> Fixture[Y, D]: ...
+
+
+@overload
+def fixture(
+    *,
+    scope: Scope = "function",
+    deferred: bool = False,
+    barrier: bool = False,
+    global_state: bool = False,
+    fail_fast: FailFast | None = None,
+    guard: bool = False,
+) -> Callable[[Callable[D, FixtureDefinition[Y]]], Fixture[Y, D]]: ...
+
+
+def fixture(  # noqa: PLR0913
+    generator_func: Callable[D, FixtureDefinition[Y]] | None = None,
+    /,
+    *,
+    scope: Scope = "function",
+    deferred: bool = False,
+    barrier: bool = False,
+    global_state: bool = False,
+    fail_fast: FailFast | None = None,
+    guard: bool = False,
+) -> Fixture[Y, D] | Callable[[Callable[D, FixtureDefinition[Y]]], Fixture[Y, D]]:
+    """
+    Create a Fixture from a fixture definition.
+
+    Applied either directly (@fixture) or with options (@fixture(scope="session")).
+    """
+    options: dict[str, Any] = {
+        "scope": scope,
+        "deferred": deferred,
+        "barrier": barrier,
+        "global_state": global_state,
+        "fail_fast": fail_fast,
+        "guard": guard,
+    }
+
+    if generator_func is not None:
+        return Fixture(generator_func, **options)
+
+    def _decorator(func: Callable[D, FixtureDefinition[Y]]) -> Fixture[Y, D]:
+        """Create the Fixture with the options closed over."""
+        return Fixture(func, **options)
+
+    return _decorator
 
 
 Q = ParamSpec("Q")
@@ -346,6 +1003,10 @@ def compose(
             with fixture_ as yielded_value:
                 yield from fixture_definition(yielded_value, *d_args, **d_kwargs)
 
+        _bind(
+            _inner, fixture_definition, Binding(fixture_, fixture_args, fixture_kwargs)
+        )
+
         return _inner
 
     return _decorator
@@ -392,6 +1053,10 @@ def compose_noinject(
             with fixture_:  # Ignore yielded value
                 yield from fixture_definition(*d_args, **d_kwargs)
 
+        _bind(
+            _inner, fixture_definition, Binding(fixture_, fixture_args, fixture_kwargs)
+        )
+
         return _inner
 
     return _decorator
@@ -415,6 +1080,87 @@ def noinject(
             with fixture_:  # Yielded value is being ignored
                 return test_function(*args, **kwargs)
 
+        _bind(_inner, test_function, Binding(fixture_, fixture_args, fixture_kwargs))
+
+        return _inner
+
+    return _decorator
+
+
+class Lazy(Generic[Y]):
+    """
+    Handle injected by lazy() giving access to the value of a fixture.
+
+    The fixture is only set up on the first access of .value (and hence only torn down
+    if it was accessed).
+    """
+
+    def __init__(
+        self,
+        fixture_: Fixture[Y, Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        stack: ExitStack,
+    ) -> None:
+        """Create handle which enters fixture_ (with (kw)args) onto stack on access."""
+        self._fixture = fixture_
+        self._args = args
+        self._kwargs = kwargs
+        self._stack = stack
+        self._entered = False
+        self._value: Y
+
+    @property
+    def is_set_up(self) -> bool:
+        """Whether the value has been accessed (and hence the fixture set up)."""
+        return self._entered
+
+    @property
+    def value(self) -> Y:
+        """Value yielded by the fixture (set up on first access)."""
+        if not self._entered:
+            self._fixture.set(*self._args, **self._kwargs)
+            self._value = self._stack.enter_context(self._fixture)
+            self._entered = True
+
+        return self._value
+
+
+def lazy(
+    fixture_: Fixture[Y, D],
+) -> Callable[[Callable[Concatenate[Lazy[Y], T], None]], Callable[T, None]]:
+    """
+    Transform a Fixture to inject a Lazy handle instead of the value.
+
+    The fixture is only set up if (and when) the test accesses the handle's .value,
+    so tests which skip or take branches not needing the value don't pay for it.
+    """
+
+    def _decorator(
+        test_function: Callable[Concatenate[Lazy[Y], T], None],
+    ) -> Callable[T, None]:
+        """Lazy decorator for test functions."""
+        fixture_args = fixture_.args
+        fixture_kwargs = fixture_.kwargs
+
+        # Now that the values have been closed over we can delete from the object
+        fixture_.reset()
+
+        @preserve_metadata(test_function)
+        def _inner(*args: T.args, **kwargs: T.kwargs) -> None:
+            """Inject handle which sets up the fixture on first access."""
+            # The stack exits the fixture (if entered) passing along any exception
+            # raised by the test
+            with ExitStack() as stack:
+                handle = Lazy(fixture_, fixture_args, fixture_kwargs, stack)
+                return test_function(handle, *args, **kwargs)
+
+        _bind(
+            _inner,
+            test_function,
+            Binding(fixture_, fixture_args, fixture_kwargs, lazy=True),
+        )
+
         return _inner
 
     return _decorator
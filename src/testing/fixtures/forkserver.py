@@ -0,0 +1,102 @@
+"""
+Fork-server execution of tests.
+
+The pytest plugin's --fixture-fork option sets up the session scoped fixtures of a
+test in the (long lived) pytest process and then runs the test in a forked child.
+The child inherits the warmed values copy-on-write, runs the setup and teardown of
+the remaining (function scoped) fixtures and the test itself, and streams its reports
+back to the parent through a pipe before exiting.
+Each test thus runs in a fresh process without paying for heavy setup again.
+
+Errors raised by deferred teardowns in the child are passed back to the parent and
+reported with its own at the end of the session.
+Only available where os.fork() exists (POSIX).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+from testing.fixtures import teardown
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+available = hasattr(os, "fork")
+
+
+def run_forked(item: pytest.Item) -> list[pytest.TestReport]:
+    """Run the test protocol (setup, call, teardown) of item in a forked child."""
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # Child
+        os.close(read_fd)
+        _run_child(item, write_fd)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        data = pipe.read()
+    _, status = os.waitpid(pid, 0)
+
+    if not data:
+        return [_crash_report(item, status)]
+
+    result = json.loads(data)
+    for fixture_name, message in result["teardown_errors"]:
+        teardown.record(fixture_name, RuntimeError(message))
+
+    return [
+        item.config.hook.pytest_report_from_serializable(
+            config=item.config, data=report
+        )
+        for report in result["reports"]
+    ]
+
+
+def _run_child(item: pytest.Item, write_fd: int) -> None:
+    """Run the test protocol and send the reports to the parent (never returns)."""
+    exit_code = 1
+    try:
+        # pytest fixtures are all torn down since the child exits right after
+        reports = runtestprotocol(item, log=False, nextitem=None)
+        serialize: Callable[..., dict[str, Any]] = (
+            item.config.hook.pytest_report_to_serializable
+        )
+        result = {
+            "reports": [
+                serialize(config=item.config, report=report) for report in reports
+            ],
+            "teardown_errors": [
+                (error.fixture_name, f"{type(error.error).__name__}: {error.error}")
+                for error in teardown.finish()
+            ],
+        }
+
+        with os.fdopen(write_fd, "w", encoding="utf-8") as pipe:
+            json.dump(result, pipe)
+
+        exit_code = 0
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Skip atexit handlers (which would tear down the inherited session fixtures)
+        os._exit(exit_code)
+
+
+def _crash_report(item: pytest.Item, status: int) -> pytest.TestReport:
+    """Report a child which exited without sending its reports."""
+    return pytest.TestReport(
+        item.nodeid,
+        item.location,
+        dict.fromkeys(item.keywords, 1),
+        "failed",
+        f"forked child running the test crashed (wait status {status})",
+        "call",
+    )
@@ -0,0 +1,139 @@
+"""
+Integration of fixtures with Hypothesis property based tests.
+
+examples() runs a test with Hypothesis (like hypothesis.given) while setting up the
+fixture once per test function rather than once per generated example:
+
+- Strategies named after parameters of the fixture definition are drawn and passed
+  to .set(), the others are drawn for the test.
+- Consecutive examples drawing the same fixture (kw)args reuse the value after running
+  the hook declared with Fixture.example_reset (which restores it cheaply).
+  Without a hook (or when the (kw)args change) the fixture is torn down and set up
+  again so no state leaks between examples.
+  The hook also runs after the last example (before the teardown) so every example
+  is followed by exactly one reset and the integrity guard accepts examples
+  mutating the value.
+
+Requires the hypothesis package.
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Any, Concatenate, Generic
+
+import hypothesis
+
+from testing.fixtures import (
+    Binding,
+    D,
+    Fixture,
+    Y,
+    _bind,
+    preserve_metadata,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from hypothesis.strategies import SearchStrategy
+
+
+class _Reused(Generic[Y]):
+    """Fixture entered across the examples of a test."""
+
+    def __init__(
+        self, fixture_: Fixture[Y, Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        """Hold fixture_ whose (kw)args are completed by the drawn ones."""
+        self._fixture = fixture_
+        self._args = args
+        self._kwargs = kwargs
+        self._drawn: dict[str, Any] | None = None  # Drawn (kw)args of the live value
+        self._value: Y
+
+    def enter(self, drawn: dict[str, Any]) -> Y:
+        """Get the value for an example (reset, or set up for the drawn (kw)args)."""
+        hook = self._fixture.example_reset_hook
+        if self._drawn is not None and self._drawn == drawn and hook is not None:
+            hook(self._value)
+            return self._value
+
+        self.close()
+        self._fixture.set(*self._args, **self._kwargs, **drawn)
+        self._value = self._fixture.__enter__()
+        self._drawn = drawn
+
+        return self._value
+
+    def close(self) -> None:
+        """Reset (if there is a hook) and tear down the live value (if any)."""
+        if self._drawn is not None:
+            self._drawn = None
+
+            # Restored (e.g. for the integrity guard to find it unchanged)
+            hook = self._fixture.example_reset_hook
+            if hook is not None:
+                hook(self._value)
+
+            self._fixture.__exit__(None, None, None)
+
+
+def examples(
+    fixture_: Fixture[Y, D], **strategies: SearchStrategy[Any]
+) -> Callable[[Callable[Concatenate[Y, ...], None]], Callable[..., None]]:
+    """
+    Run the decorated test for examples drawn by Hypothesis from strategies.
+
+    The fixture's value is injected (as for @fixture_) but reused across examples.
+    The (kw)args set on the fixture at decoration are combined with the drawn ones.
+    Use hypothesis.settings (applied outside) to configure the run.
+    """
+    fixture_params = inspect.signature(fixture_.definition).parameters
+    drawn_for_fixture = [name for name in strategies if name in fixture_params]
+
+    def _decorator(
+        test_function: Callable[Concatenate[Y, ...], None],
+    ) -> Callable[..., None]:
+        """Wrap test with Hypothesis."""
+        fixture_args = fixture_.args
+        fixture_kwargs = fixture_.kwargs
+
+        # Now that the values have been closed over we can delete from the object
+        fixture_.reset()
+
+        reused = _Reused(fixture_, fixture_args, fixture_kwargs)
+
+        def _example(*args: object, **kwargs: object) -> None:
+            """Run the test for one example."""
+            drawn = {name: kwargs.pop(name) for name in drawn_for_fixture}
+            test_function(reused.enter(drawn), *args, **kwargs)
+
+        # Hypothesis fills in the drawn parameters, the others are passed through
+        passed = list(inspect.signature(test_function).parameters.values())[1:]
+        fixture_side = [
+            inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY)
+            for name in drawn_for_fixture
+        ]
+        _example.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+            [*passed, *fixture_side]
+        )
+        run = hypothesis.given(**strategies)(_example)
+
+        @preserve_metadata(test_function)
+        def _inner(*args: object, **kwargs: object) -> None:
+            """Run all examples and tear down the fixture after the last."""
+            try:
+                run(*args, **kwargs)
+            finally:
+                reused.close()
+
+        # Only the passed through parameters remain visible (e.g. to pytest)
+        _inner.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+            [param for param in passed if param.name not in strategies]
+        )
+        _bind(_inner, test_function, Binding(fixture_, fixture_args, fixture_kwargs))
+
+        return _inner
+
+    return _decorator
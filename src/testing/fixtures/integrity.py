@@ -0,0 +1,108 @@
+"""
+Detection of tests mutating shared fixture values.
+
+Sharing a value between tests (by a session scope, or by reentrance) is only safe if
+no test mutates it.
+A Fixture created with guard=True (or every Fixture, once enabled e.g. by the pytest
+plugin's --fixture-guard option) fingerprints its value after the setup and checks
+the fingerprint again on every exit.
+A changed value fails the test which was exiting (i.e. the one that mutated it) with
+FixtureMutatedError and a session scoped value is torn down rather than passed on
+to the next test.
+
+Values are fingerprinted by hashing their pickle, or (for unpicklable values, e.g.
+holding a lock or a socket) by walking their containers and attributes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+enabled = False
+
+# Values digested by their repr: atoms and objects compared by identity
+_BY_REPR = (
+    *(str, bytes, int, float, complex, bool, type(None)),
+    *(type, ModuleType, FunctionType, BuiltinFunctionType, MethodType),
+)
+
+
+class FixtureMutatedError(AssertionError):
+    """The value of a guarded fixture was changed while a test used it."""
+
+
+def enable(flag: bool = True) -> None:
+    """Enable (or disable) guarding the values of all fixtures."""
+    global enabled  # noqa: PLW0603
+    enabled = flag
+
+
+def fingerprint(value: object) -> bytes:
+    """Digest the contents of value (equal for values with unchanged contents)."""
+    try:
+        return _digest(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:  # noqa: BLE001  # Unpicklable so walk the value instead
+        digest = hashlib.blake2b(digest_size=16)
+        _walk(value, digest, set())
+        return digest.digest()
+
+
+def _digest(data: bytes) -> bytes:
+    """Digest data."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _walk(value: object, digest: Any, seen: set[int]) -> None:  # noqa: ANN401
+    """Feed the type and contents of value (recursively) into digest."""
+    digest.update(type(value).__qualname__.encode())
+
+    if isinstance(value, _BY_REPR):
+        digest.update(repr(value).encode())
+        return
+
+    if id(value) in seen:  # Reference cycle (or shared reference)
+        return
+    seen.add(id(value))
+
+    if isinstance(value, bytearray | memoryview):
+        digest.update(bytes(value))
+    elif isinstance(value, list | tuple):
+        for item in value:
+            _walk(item, digest, seen)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _walk(key, digest, seen)
+            _walk(item, digest, seen)
+    elif isinstance(value, set | frozenset):
+        for item_digest in sorted(fingerprint(item) for item in value):
+            digest.update(item_digest)
+    else:
+        _walk_attributes(value, digest, seen)
+
+
+def _walk_attributes(value: object, digest: Any, seen: set[int]) -> None:  # noqa: ANN401
+    """Feed the attributes (or the repr if it has none) of value into digest."""
+    state = getattr(value, "__dict__", None)
+    slots = [
+        name
+        for cls in type(value).__mro__
+        for name in _slot_names(cls)
+        if name not in {"__dict__", "__weakref__"}
+    ]
+    if state is None and not slots:
+        digest.update(repr(value).encode())  # Opaque (e.g. a lock)
+        return
+
+    if state is not None:
+        _walk(state, digest, seen)
+    for name in slots:
+        _walk(getattr(value, name, None), digest, seen)
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Get the names of the slots declared by cls (itself, not its bases)."""
+    slots = vars(cls).get("__slots__", ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
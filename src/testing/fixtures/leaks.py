@@ -0,0 +1,85 @@
+"""
+Detection of fixture values that outlive their test.
+
+Once tracking is enabled (e.g. by the pytest plugin's --fixture-leaks option) every
+value released by a Fixture after its last exit is watched through a weak reference.
+collect() then reports the values which are still alive, i.e. which something (a
+module global, a cache, a reference cycle) is keeping alive after the test.
+Values which can't be weakly referenced (e.g. dict, list, int) are not tracked.
+Values of deferred fixtures are only watched once their background teardown is done
+(so a later collect() reports them).
+"""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+enabled = False
+
+
+@dataclass
+class Leak:
+    """A fixture value still alive after the fixture was exited."""
+
+    fixture_name: str
+    type_name: str
+
+
+_tracked: list[tuple[str, weakref.ref[object]]] = []
+
+
+def enable(flag: bool = True) -> None:
+    """Enable (or disable) tracking of released fixture values."""
+    global enabled  # noqa: PLW0603
+    enabled = flag
+
+    if not flag:
+        _tracked.clear()
+
+
+def track(fixture_name: str, value: object) -> None:
+    """Watch a value released by the named fixture."""
+    track_later(fixture_name, value)()
+
+
+def track_later(fixture_name: str, value: object) -> Callable[[], None]:
+    """
+    Get a function watching value once called, without keeping it alive meanwhile.
+
+    Used for deferred teardowns whose generator refers to the value until it ran.
+    """
+    try:
+        ref = weakref.ref(value)
+    except TypeError:  # Values which can't be weakly referenced are skipped
+        return lambda: None
+
+    def _track() -> None:
+        """Start watching the value."""
+        _tracked.append((fixture_name, ref))
+
+    return _track
+
+
+def collect() -> list[Leak]:
+    """Return (and stop watching) the tracked values which are still alive."""
+    if not _tracked:
+        return []
+
+    # Values only kept alive by reference cycles are not leaks
+    if any(ref() is not None for _, ref in _tracked):
+        gc.collect()
+
+    leaked = [
+        Leak(name, type(value).__name__)
+        for name, ref in _tracked
+        if (value := ref()) is not None
+    ]
+    _tracked.clear()
+
+    return leaked
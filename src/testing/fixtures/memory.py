@@ -0,0 +1,153 @@
+"""
+Per-fixture memory accounting.
+
+A MemoryAccountant (registered via add_observer(), e.g. by the pytest plugin's
+--fixture-memory option) snapshots the memory traced by tracemalloc and the RSS of the
+process around the setup and teardown of every fixture.
+Memory is attributed to each fixture and (kw)args it was set up with:
+
+- setup: memory allocated by the setup (pre-yield part) of the fixture.
+- retained: memory allocated by the setup and not freed by the teardown (post-yield
+  part), i.e. what the fixture left behind.
+  Only the setup and teardown themselves are measured so memory kept by the test
+  (which runs in between) isn't blamed on the fixture.
+
+Figures include the fixtures composed into a fixture's definition and, since they are
+process wide, anything allocated concurrently (e.g. by deferred teardowns).
+tracemalloc must be tracing for allocations to be accounted; RSS is only available
+where /proc/self/statm exists (Linux).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from testing.fixtures import Observer
+
+if TYPE_CHECKING:
+    from testing.fixtures import Binding
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss() -> int | None:
+    """Get the resident set size (in bytes) of the process (None if unavailable)."""
+    try:
+        statm = Path("/proc/self/statm").read_text(encoding="ascii")
+    except OSError:
+        return None
+
+    return int(statm.split()[1]) * _PAGE_SIZE
+
+
+@dataclass
+class Snapshot:
+    """Memory of the process at a point in time."""
+
+    traced: int
+    rss: int | None
+
+    @classmethod
+    def take(cls) -> Snapshot:
+        """Snapshot the memory currently traced by tracemalloc and the RSS."""
+        return cls(tracemalloc.get_traced_memory()[0], rss())
+
+    def __add__(self, other: Snapshot) -> Snapshot:
+        """Sum of two differences between snapshots."""
+        return Snapshot(
+            self.traced + other.traced,
+            None if self.rss is None or other.rss is None else self.rss + other.rss,
+        )
+
+    def __sub__(self, other: Snapshot) -> Snapshot:
+        """Difference between two snapshots."""
+        return Snapshot(
+            self.traced - other.traced,
+            None if self.rss is None or other.rss is None else self.rss - other.rss,
+        )
+
+
+@dataclass
+class FixtureMemory:
+    """Memory accounted to a fixture set up with particular (kw)args."""
+
+    name: str
+    setups: int = 0
+    setup_bytes: int = 0
+    retained_bytes: int = 0
+    rss_bytes: int | None = 0  # Net RSS growth over the setup and teardown
+
+    def add(self, setup: Snapshot, retained: Snapshot) -> None:
+        """Account memory of one setup and teardown."""
+        self.setups += 1
+        self.setup_bytes += setup.traced
+        self.retained_bytes += retained.traced
+        self.rss_bytes = (
+            None
+            if self.rss_bytes is None or retained.rss is None
+            else self.rss_bytes + retained.rss
+        )
+
+
+class MemoryAccountant(Observer):
+    """Observer attributing memory to the fixtures set up and torn down."""
+
+    def __init__(self) -> None:
+        """Create accountant with no memory accounted."""
+        self._lock = threading.Lock()  # Deferred teardowns are notified from threads
+        # Keyed by the id of the Binding created by each setup (and passed to its
+        # teardown) since a deferred teardown may overlap the next setup of the
+        # fixture; the binding is held to keep the id from being reused
+        self._setup_started: dict[int, Snapshot] = {}
+        self._setup: dict[int, tuple[Binding, Snapshot]] = {}
+        self._teardown_started: dict[int, Snapshot] = {}
+        self._stats: dict[str, FixtureMemory] = {}
+
+    def setup_started(self, binding: Binding) -> None:
+        """Snapshot memory before the setup."""
+        snapshot = Snapshot.take()
+        with self._lock:
+            self._setup_started[id(binding)] = snapshot
+
+    def setup_finished(self, binding: Binding) -> None:
+        """Record memory allocated by the setup."""
+        snapshot = Snapshot.take()
+        with self._lock:
+            before = self._setup_started.pop(id(binding), None)
+            if before is not None:
+                self._setup[id(binding)] = (binding, snapshot - before)
+
+    def teardown_started(self, binding: Binding) -> None:
+        """Snapshot memory before the teardown."""
+        snapshot = Snapshot.take()
+        with self._lock:
+            self._teardown_started[id(binding)] = snapshot
+
+    def teardown_finished(self, binding: Binding) -> None:
+        """Attribute memory allocated by the setup and not freed by the teardown."""
+        snapshot = Snapshot.take()
+        with self._lock:
+            before = self._teardown_started.pop(id(binding), None)
+            _, setup = self._setup.pop(id(binding), (None, None))
+            if before is None or setup is None:
+                return
+
+            name = binding.describe()
+            stats = self._stats.setdefault(name, FixtureMemory(name))
+            stats.add(setup, setup + (snapshot - before))
+
+    def report(self, top: int | None = None) -> list[FixtureMemory]:
+        """Get the (top) fixtures ordered by memory retained (largest first)."""
+        with self._lock:
+            stats = sorted(
+                self._stats.values(),
+                key=lambda stats: (stats.retained_bytes, stats.setup_bytes),
+                reverse=True,
+            )
+
+        return stats[:top]
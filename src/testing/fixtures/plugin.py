@@ -0,0 +1,492 @@
+"""
+pytest plugin for testing.fixtures.
+
+Registered through the pytest11 entry point so it is active whenever the package is
+installed alongside pytest.
+
+- Tears down session scoped fixtures at the end of the pytest session.
+- Generates one test item per cell of tests decorated with Fixture.matrix().
+- --fixture-leaks: reports fixture values which are still alive after their test.
+- --fixture-guard: fails tests which mutate the value of any fixture (see integrity).
+- --fixture-memory: traces allocations (tracemalloc) and RSS around fixture setups
+  and teardowns and reports the fixtures retaining the most memory.
+- Waits for deferred teardowns at the end of the session reporting any errors they
+  raised (which fail the session).
+- --fixture-affinity: reorders tests so that tests sharing a session scoped fixture
+  (with the same (kw)args) run back to back, which lets its live value be reused
+  instead of being torn down and set up again.
+  Each group of such tests is also marked with xdist_group so that with
+  `pytest -n <workers> --dist loadgroup` each group is scheduled onto a single worker.
+- --fixture-prefetch: while a test runs, the setup of the fixtures applied to the next
+  test is started in a background thread and handed over when that test enters them.
+  Only fixtures that are safe to set up concurrently are prefetched: function scoped
+  fixtures which neither compose other fixtures nor touch global state, are not used
+  by the running test, and are bound exactly once (and not lazily) in the next test.
+- --fixture-trace / --fixture-trace-otel: emit fixture setups and teardowns and test
+  calls as nested spans to a Chrome trace file / OpenTelemetry (see trace).
+- --fixture-fork: sets up the session scoped fixtures of each test in the pytest
+  process and runs the test in a forked child which inherits them (see forkserver).
+"""
+
+from __future__ import annotations
+
+import os
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from testing.fixtures import (
+    MATRIX_CELL,
+    Binding,
+    Fixture,
+    add_observer,
+    close_session_fixtures,
+    forkserver,
+    get_bindings,
+    get_matrix,
+    integrity,
+    leaks,
+    remove_observer,
+    teardown,
+)
+from testing.fixtures.memory import MemoryAccountant
+from testing.fixtures.trace import ChromeTracer, OtelTracer, Tracer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterator
+
+_teardown_errors_key = pytest.StashKey[list[teardown.TeardownError]]()
+_prefetch_executor_key = pytest.StashKey[ThreadPoolExecutor]()
+_prefetched_key = pytest.StashKey[list[Fixture[Any, Any]]]()
+_leaks_key = pytest.StashKey[list[tuple[str, leaks.Leak]]]()
+_memory_key = pytest.StashKey[MemoryAccountant]()
+_tracemalloc_started_key = pytest.StashKey[bool]()
+_tracers_key = pytest.StashKey[list[Tracer]]()
+
+# Identifies a session scoped fixture together with the (kw)args it is set up with
+AffinityKey = tuple[int, str]
+Affinity = frozenset[AffinityKey]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command-line options of the plugin."""
+    group = parser.getgroup("testing-fixtures")
+    group.addoption(
+        "--fixture-affinity",
+        action="store_true",
+        default=False,
+        help="Reorder (and xdist group) tests by the session scoped fixtures they use",
+    )
+    group.addoption(
+        "--fixture-prefetch",
+        action="store_true",
+        default=False,
+        help="Set up the fixtures of the next test while the current one runs",
+    )
+    group.addoption(
+        "--fixture-leaks",
+        action="store_true",
+        default=False,
+        help="Report fixture values still alive after their test",
+    )
+    group.addoption(
+        "--fixture-guard",
+        action="store_true",
+        default=False,
+        help="Fail tests which mutate the (shared) value of a fixture",
+    )
+    group.addoption(
+        "--fixture-trace",
+        metavar="PATH",
+        default=None,
+        help="Write fixture and test spans to a Chrome trace (Perfetto) file",
+    )
+    group.addoption(
+        "--fixture-trace-otel",
+        action="store_true",
+        default=False,
+        help="Emit fixture and test spans through OpenTelemetry",
+    )
+    group.addoption(
+        "--fixture-fork",
+        action="store_true",
+        default=False,
+        help="Run each test in a child forked after setting up its session fixtures",
+    )
+    group.addoption(
+        "--fixture-memory",
+        action="store_true",
+        default=False,
+        help="Account memory allocated and retained by each fixture (tracemalloc)",
+    )
+    group.addoption(
+        "--fixture-memory-top",
+        type=int,
+        default=10,
+        help="Number of fixtures reported by --fixture-memory (default: 10)",
+    )
+
+
+def _create_tracers(config: pytest.Config) -> list[Tracer]:
+    """Create the tracers requested by the --fixture-trace(-otel) options."""
+    tracers: list[Tracer] = []
+    trace_path = config.getoption("fixture_trace")
+    if trace_path is not None:
+        path = Path(trace_path)
+        if not hasattr(config, "workerinput"):  # xdist workers append to the file
+            ChromeTracer.create(path)
+        tracers.append(
+            ChromeTracer(path, os.environ.get("PYTEST_XDIST_WORKER", "main"))
+        )
+    if config.getoption("fixture_trace_otel"):
+        tracers.append(OtelTracer())
+
+    return tracers
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the xdist_group marker and enable leak/guard/memory tracking."""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): schedule tests of a group onto one xdist worker"
+    )
+
+    if config.getoption("fixture_leaks"):
+        leaks.enable()
+        config.stash[_leaks_key] = []
+
+    if config.getoption("fixture_guard"):
+        integrity.enable()
+
+    if config.getoption("fixture_memory"):
+        config.stash[_tracemalloc_started_key] = not tracemalloc.is_tracing()
+        tracemalloc.start()
+        accountant = MemoryAccountant()
+        add_observer(accountant)
+        config.stash[_memory_key] = accountant
+
+    tracers = _create_tracers(config)
+    for tracer in tracers:
+        add_observer(tracer)
+    config.stash[_tracers_key] = tracers
+
+    if config.getoption("fixture_fork"):
+        if not forkserver.available:
+            err_msg = "--fixture-fork requires os.fork()"
+            raise pytest.UsageError(err_msg)
+        if config.getoption("fixture_prefetch"):
+            # Forking while prefetch threads run setups would clone them mid-flight
+            err_msg = "--fixture-fork can't be combined with --fixture-prefetch"
+            raise pytest.UsageError(err_msg)
+
+        config.pluginmanager.register(ForkServer(), "testing-fixtures-forkserver")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Stop guarding, memory accounting and tracing (if started)."""
+    if config.getoption("fixture_guard"):
+        integrity.enable(flag=False)
+
+    for tracer in config.stash.get(_tracers_key, []):
+        remove_observer(tracer)
+        if isinstance(tracer, ChromeTracer):
+            tracer.close()
+
+    accountant = config.stash.get(_memory_key, None)
+    if accountant is not None:
+        remove_observer(accountant)
+        if config.stash[_tracemalloc_started_key]:
+            tracemalloc.stop()
+
+
+def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item | None) -> None:
+    """
+    Close the fixtures shared by matrix cells and record leaked fixture values.
+
+    The shared fixtures are closed after the last cell which runs (rather than the
+    last one declared) since cells may be deselected or run on other xdist workers.
+    """
+    matrix = get_matrix(item.obj) if isinstance(item, pytest.Function) else None
+    if matrix is not None and (
+        not isinstance(nextitem, pytest.Function)
+        or get_matrix(nextitem.obj) is not matrix
+    ):
+        matrix.finish()
+
+    if leaks.enabled:
+        item.config.stash[_leaks_key].extend(
+            (item.nodeid, leak) for leak in leaks.collect()
+        )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:
+    """Emit a span around the test call (nesting the spans of its fixtures)."""
+    tracers = item.config.stash.get(_tracers_key, [])
+    name = f"test {item.nodeid}"
+    for tracer in tracers:
+        tracer.begin(name, "test")
+    try:
+        return (yield)
+    finally:
+        for tracer in reversed(tracers):
+            tracer.end(name, "test")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize matrix tests with their cells."""
+    if MATRIX_CELL not in metafunc.fixturenames:
+        return
+
+    matrix = get_matrix(metafunc.function)
+    if matrix is None:
+        return
+
+    # Unless parallel, keep the cells on one xdist worker to share composed fixtures
+    marks = (
+        []
+        if matrix.parallel
+        else [pytest.mark.xdist_group(name=f"matrix:{metafunc.definition.nodeid}")]
+    )
+    metafunc.parametrize(
+        MATRIX_CELL,
+        [
+            pytest.param(index, id=id_, marks=marks)
+            for index, id_ in enumerate(matrix.ids)
+        ],
+    )
+
+
+def _walk(bindings: tuple[Binding, ...], seen: set[int]) -> Iterator[Binding]:
+    """
+    Yield bindings (recursing into composed fixtures) the first time a fixture is seen.
+
+    The first (outermost) binding of a fixture is the one whose (kw)args take
+    precedence during the test so later ones are skipped.
+    """
+    for binding in bindings:
+        if id(binding.fixture) in seen:
+            continue
+
+        seen.add(id(binding.fixture))
+        yield binding
+        yield from _walk(get_bindings(binding.fixture.definition), seen)
+
+
+def get_affinity(function: Callable[..., Any]) -> Affinity:
+    """Get the session scoped fixtures (and their (kw)args) used by a test."""
+    return frozenset(
+        (id(binding.fixture), binding.describe())
+        for binding in _walk(get_bindings(function), set())
+        if binding.fixture.scope == "session" and binding.matrix is None
+    )
+
+
+def order_by_affinity(affinities: list[Affinity]) -> list[list[int]]:
+    """
+    Group the indices of tests by affinity and order the groups.
+
+    Tests without affinity keep their place at the front (in their original order).
+    Groups are ordered greedily: each next group is the one sharing the most keys with
+    the previous group (ties broken by first appearance) so that live values survive
+    across group boundaries as well.
+    """
+    free = [index for index, affinity in enumerate(affinities) if not affinity]
+    groups: dict[Affinity, list[int]] = {}
+    for index, affinity in enumerate(affinities):
+        if affinity:
+            groups.setdefault(affinity, []).append(index)
+
+    ordered = [free] if free else []
+    remaining = list(groups)
+    previous: Affinity = frozenset()
+    while remaining:
+        best = max(remaining, key=lambda affinity: len(affinity & previous))
+        remaining.remove(best)
+        ordered.append(groups[best])
+        previous = best
+
+    return ordered
+
+
+@pytest.hookimpl(tryfirst=True)  # Before xdist reads the xdist_group marks
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Reorder tests by fixture affinity (when requested)."""
+    if not config.getoption("fixture_affinity"):
+        return
+
+    affinities = [
+        get_affinity(item.obj) if isinstance(item, pytest.Function) else frozenset()
+        for item in items
+    ]
+
+    reordered: list[pytest.Item] = []
+    for group in order_by_affinity(affinities):
+        affinity = affinities[group[0]]
+        if affinity:
+            name = " ".join(sorted(description for _, description in affinity))
+            for index in group:
+                items[index].add_marker(pytest.mark.xdist_group(name=name))
+
+        reordered.extend(items[index] for index in group)
+
+    items[:] = reordered
+
+
+def warm(function: Callable[..., Any]) -> None:
+    """Set up (and keep alive) the session scoped fixtures used by a test."""
+    for binding in _walk(get_bindings(function), set()):
+        if binding.fixture.scope == "session" and binding.matrix is None:
+            with binding.fixture.set(*binding.args, **binding.kwargs):
+                pass
+
+
+class ForkServer:
+    """Plugin running each test in a child forked from the warmed pytest process."""
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> bool:
+        """Warm the session scoped fixtures of item and run it in a forked child."""
+        if isinstance(item, pytest.Function):
+            # A failing setup is reproduced (and reported) by the child
+            with suppress(Exception):
+                warm(item.obj)
+
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for report in forkserver.run_forked(item):
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+        return True
+
+
+def _all_bindings(bindings: tuple[Binding, ...]) -> Iterator[Binding]:
+    """Yield all bindings including those of composed fixtures (with repeats)."""
+    for binding in bindings:
+        yield binding
+        yield from _all_bindings(get_bindings(binding.fixture.definition))
+
+
+def get_prefetchable(
+    function: Callable[..., Any], running: Callable[..., Any] | None = None
+) -> list[Binding]:
+    """Get the bindings of a test which are safe to prefetch while running runs."""
+    counts = Counter(
+        id(binding.fixture) for binding in _all_bindings(get_bindings(function))
+    )
+    busy = (
+        {id(binding.fixture) for binding in _all_bindings(get_bindings(running))}
+        if running is not None
+        else set()
+    )
+
+    return [
+        binding
+        for binding in get_bindings(function)
+        if counts[id(binding.fixture)] == 1
+        and not binding.lazy
+        and binding.matrix is None
+        and id(binding.fixture) not in busy
+        and binding.fixture.scope == "function"
+        and not binding.fixture.global_state
+        and not get_bindings(binding.fixture.definition)
+    ]
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(
+    item: pytest.Item, nextitem: pytest.Item | None
+) -> Generator[None, object, object]:
+    """Prefetch fixtures of the next test while running item (when requested)."""
+    config = item.config
+    if not config.getoption("fixture_prefetch"):
+        return (yield)
+
+    executor = config.stash.get(_prefetch_executor_key, None)
+    if executor is None:
+        executor = ThreadPoolExecutor(thread_name_prefix="fixture-prefetch")
+        config.stash[_prefetch_executor_key] = executor
+
+    # Prefetches for this item which it did not take over (e.g. skipped)
+    leftover = config.stash.get(_prefetched_key, [])
+
+    prefetched = []
+    if isinstance(nextitem, pytest.Function) and isinstance(item, pytest.Function):
+        for binding in get_prefetchable(nextitem.obj, item.obj):
+            binding.fixture.set(*binding.args, **binding.kwargs).prefetch(executor)
+            prefetched.append(binding.fixture)
+
+    config.stash[_prefetched_key] = prefetched
+
+    try:
+        return (yield)
+    finally:
+        for fixture_ in leftover:
+            fixture_.discard_prefetch()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Tear down session scoped fixtures and wait for deferred teardowns."""
+    close_session_fixtures()
+
+    for fixture_ in session.config.stash.get(_prefetched_key, []):
+        fixture_.discard_prefetch()
+
+    executor = session.config.stash.get(_prefetch_executor_key, None)
+    if executor is not None:
+        executor.shutdown()
+
+    errors = teardown.finish()
+    session.config.stash[_teardown_errors_key] = errors
+
+    if errors and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """Report deferred teardown errors, leaked values, and memory used by fixtures."""
+    errors = config.stash.get(_teardown_errors_key, [])
+    if errors:
+        terminalreporter.section("deferred fixture teardown errors", red=True)
+        for error in errors:
+            terminalreporter.write_line(
+                f"{error.fixture_name}: {type(error.error).__name__}: {error.error}"
+            )
+
+    leaked = config.stash.get(_leaks_key, [])
+    if leaked:
+        terminalreporter.section("fixture values alive after their test", yellow=True)
+        for nodeid, leak in leaked:
+            terminalreporter.write_line(
+                f"{nodeid}: {leak.fixture_name} ({leak.type_name})"
+            )
+
+    accountant = config.stash.get(_memory_key, None)
+    if accountant is not None:
+        terminalreporter.section("fixture memory (retained after teardown)")
+        for stats in accountant.report(config.getoption("fixture_memory_top")):
+            rss = "n/a" if stats.rss_bytes is None else _format_bytes(stats.rss_bytes)
+            terminalreporter.write_line(
+                f"{stats.name}: retained {_format_bytes(stats.retained_bytes)}, "
+                f"setup {_format_bytes(stats.setup_bytes)}, rss {rss} "
+                f"over {stats.setups} setup(s)"
+            )
+
+
+def _format_bytes(size: int) -> str:
+    """Format a (signed) number of bytes in human readable units."""
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:  # noqa: PLR2004
+            return f"{value:.1f} {unit}"
+        value /= 1024
+
+    return f"{value:.1f} GiB"
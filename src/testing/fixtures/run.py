@@ -0,0 +1,278 @@
+"""
+Minimal standalone runner for tests using these fixtures.
+
+Since fixtures are plain decorators the tests don't need pytest's collection and
+plugin machinery to run:
+
+    python -m testing.fixtures.run [paths] [-k SUBSTRING] [-j JOBS] [--junit-xml PATH]
+
+Test modules (test_*.py under the given paths) are split into one shard per job and
+each shard runs in a worker process, so session scoped fixtures are shared by the
+tests of a shard and torn down (along with waiting for deferred teardowns) at its end.
+Test functions (test*) taking no arguments are run, matrix tests once per cell.
+Tests needing arguments (e.g. pytest fixtures) are skipped.
+The pytest.mark skip, skipif (with a boolean condition) and xfail marks are honoured.
+pytest itself is never imported, keeping startup to tens of milliseconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from testing.fixtures import (
+    MATRIX_CELL,
+    close_session_fixtures,
+    get_matrix,
+    teardown,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import ModuleType
+
+Outcome = Literal["passed", "failed", "skipped", "xfailed"]
+
+
+@dataclass
+class Result:
+    """Result of running a single test."""
+
+    module: str
+    name: str
+    outcome: Outcome
+    duration: float = 0.0
+    message: str = ""
+    details: str = ""  # Formatted traceback of failures
+
+
+def discover(paths: list[Path]) -> list[Path]:
+    """Find the test modules (test_*.py) under paths."""
+    modules: set[Path] = set()
+    for path in paths:
+        if path.is_dir():
+            modules.update(path.rglob("test_*.py"))
+        elif path.suffix == ".py":
+            modules.add(path)
+
+    return sorted(module.resolve() for module in modules)
+
+
+def import_module(path: Path) -> ModuleType:
+    """Import module at path as part of its package (so relative imports work)."""
+    parts = [path.stem]
+    root = path.parent
+    while (root / "__init__.py").exists():
+        parts.insert(0, root.name)
+        root = root.parent
+
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+
+    return importlib.import_module(".".join(parts))
+
+
+def collect(
+    module: ModuleType, keyword: str | None
+) -> Iterator[tuple[str, Callable[..., Any], dict[str, Any]]]:
+    """Yield (name, test function, kwargs) for each test (cell) of a module."""
+    for name, function in vars(module).items():
+        if not name.startswith("test") or not inspect.isfunction(function):
+            continue
+
+        matrix = get_matrix(function)
+        tests: list[tuple[str, dict[str, Any]]]
+        if matrix is None:
+            tests = [(name, {})]
+        else:
+            tests = [
+                (f"{name}[{id_}]", {MATRIX_CELL: index})
+                for index, id_ in enumerate(matrix.ids)
+            ]
+
+        for test_name, kwargs in tests:
+            if keyword is None or keyword in test_name:
+                yield test_name, function, kwargs
+
+
+def _marks(function: Callable[..., Any]) -> dict[str, Any]:
+    """Get the pytest marks (by name) applied to a test."""
+    return {mark.name: mark for mark in getattr(function, "pytestmark", [])}
+
+
+def run_test(
+    module: str, name: str, function: Callable[..., Any], kwargs: dict[str, Any]
+) -> Result:
+    """Run a single test."""
+    marks = _marks(function)
+    skipif = marks.get("skipif")
+    if "skip" in marks or (skipif is not None and skipif.args and skipif.args[0]):
+        return Result(module, name, "skipped", message="skipped by mark")
+
+    required = [
+        param.name
+        for param in inspect.signature(function).parameters.values()
+        if param.default is param.empty
+        and param.kind not in {param.VAR_POSITIONAL, param.VAR_KEYWORD}
+        and param.name not in kwargs
+    ]
+    if required:
+        return Result(module, name, "skipped", message=f"needs {', '.join(required)}")
+
+    start = time.perf_counter()
+    try:
+        function(**kwargs)
+    except KeyboardInterrupt:
+        raise
+    except BaseException as exc:  # noqa: BLE001  # Reported as the test's outcome
+        result = _failure(module, name, exc, time.perf_counter() - start)
+        if result.outcome == "failed" and "xfail" in marks:
+            result.outcome = "xfailed"
+        return result
+
+    return Result(module, name, "passed", time.perf_counter() - start)
+
+
+def _failure(module: str, name: str, exc: BaseException, duration: float) -> Result:
+    """Get result for an exception raised by a test (or importing its module)."""
+    message = f"{type(exc).__name__}: {exc}"
+    if type(exc).__name__ == "Skipped":  # pytest.skip() (or importorskip())
+        return Result(module, name, "skipped", duration, message)
+
+    return Result(module, name, "failed", duration, message, traceback.format_exc())
+
+
+def run_shard(paths: list[Path], keyword: str | None) -> list[Result]:
+    """Run the tests of the modules at paths (in this process)."""
+    results = []
+    for path in paths:
+        try:
+            module = import_module(path)
+        except KeyboardInterrupt:
+            raise
+        except BaseException as exc:  # noqa: BLE001  # Reported as the module's outcome
+            results.append(_failure(str(path), "<import>", exc, 0.0))
+            continue
+
+        tests = list(collect(module, keyword))
+        for index, (name, function, kwargs) in enumerate(tests):
+            results.append(run_test(module.__name__, name, function, kwargs))
+
+            # Cells filtered out by the keyword never run so close after the last one
+            matrix = get_matrix(function)
+            following = tests[index + 1][1] if index + 1 < len(tests) else None
+            if matrix is not None and following is not function:
+                matrix.finish()
+
+    close_session_fixtures()
+    results.extend(
+        Result(
+            "<teardown>",
+            error.fixture_name,
+            "failed",
+            message=f"{type(error.error).__name__}: {error.error}",
+        )
+        for error in teardown.finish()
+    )
+
+    return results
+
+
+def write_junit_xml(results: list[Result], path: Path, duration: float) -> None:
+    """Write results as a JUnit XML report."""
+    suite = ET.Element(
+        "testsuite",
+        name="testing.fixtures.run",
+        tests=str(len(results)),
+        failures=str(sum(result.outcome == "failed" for result in results)),
+        errors="0",
+        skipped=str(
+            sum(result.outcome in {"skipped", "xfailed"} for result in results)
+        ),
+        time=f"{duration:.3f}",
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname=result.module,
+            name=result.name,
+            time=f"{result.duration:.3f}",
+        )
+        if result.outcome == "failed":
+            failure = ET.SubElement(case, "failure", message=result.message)
+            failure.text = result.details
+        elif result.outcome != "passed":
+            ET.SubElement(case, "skipped", message=result.message or result.outcome)
+
+    root = ET.Element("testsuites")
+    root.append(suite)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m testing.fixtures.run",
+        description="Run tests using testing.fixtures without pytest",
+    )
+    parser.add_argument("paths", nargs="*", type=Path, default=[Path("tests")])
+    parser.add_argument("-k", dest="keyword", help="Only run tests whose name has this")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of worker processes"
+    )
+    parser.add_argument("--junit-xml", type=Path, help="Write a JUnit XML report")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the tests and return the exit code (1 if any failed)."""
+    args = _parse_args(argv)
+    start = time.perf_counter()
+
+    modules = discover(args.paths)
+    jobs = max(1, min(args.jobs, len(modules)))
+    if jobs == 1:
+        results = run_shard(modules, args.keyword)
+    else:
+        shards = [modules[index::jobs] for index in range(jobs)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(run_shard, shard, args.keyword) for shard in shards
+            ]
+            results = [result for future in futures for result in future.result()]
+
+    duration = time.perf_counter() - start
+
+    failed = [result for result in results if result.outcome == "failed"]
+    for result in failed:
+        sys.stdout.write(f"FAILED {result.module}::{result.name} - {result.message}\n")
+        sys.stdout.write(result.details)
+
+    counts = {
+        outcome: sum(result.outcome == outcome for result in results)
+        for outcome in ("passed", "failed", "skipped", "xfailed")
+    }
+    summary = ", ".join(
+        f"{count} {outcome}" for outcome, count in counts.items() if count
+    )
+    sys.stdout.write(f"{summary or 'no tests ran'} in {duration:.2f}s\n")
+
+    if args.junit_xml is not None:
+        write_junit_xml(results, args.junit_xml, duration)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Background execution of deferred fixture teardowns.
+
+Fixtures created with @fixture(deferred=True) hand the post-yield part of their
+definition to a pool of worker threads instead of running it before the next test can
+start.
+Errors raised by deferred teardowns are collected and reported by finish() (called by
+the pytest plugin at the end of the session).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Maximum number of teardowns running concurrently
+MAX_WORKERS = int(os.environ.get("FIXTURE_TEARDOWN_WORKERS", "4"))
+
+
+@dataclass
+class TeardownError:
+    """Error raised by the deferred teardown of a fixture."""
+
+    fixture_name: str
+    error: BaseException
+
+
+_executor: ThreadPoolExecutor | None = None
+_pending: set[Future[None]] = set()
+_errors: list[TeardownError] = []
+_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the worker pool on first use."""
+    global _executor  # noqa: PLW0603
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="fixture-teardown"
+        )
+
+    return _executor
+
+
+def submit(fixture_name: str, teardown: Callable[[], None]) -> Future[None]:
+    """Queue teardown (of the named fixture) to run in the background."""
+
+    def _run() -> None:
+        """Run teardown collecting (rather than raising) any error."""
+        try:
+            teardown()
+        except BaseException as exc:  # noqa: BLE001  # Reported by finish()
+            record(fixture_name, exc)
+
+    with _lock:
+        future = _get_executor().submit(_run)
+        _pending.add(future)
+
+    future.add_done_callback(_discard)
+
+    return future
+
+
+def record(fixture_name: str, error: BaseException) -> None:
+    """Record an error raised by the teardown of the named fixture."""
+    with _lock:
+        _errors.append(TeardownError(fixture_name, error))
+
+
+def _discard(future: Future[None]) -> None:
+    """Forget a completed teardown."""
+    with _lock:
+        _pending.discard(future)
+
+
+def finish() -> list[TeardownError]:
+    """Wait for all queued teardowns and return (and clear) the errors collected."""
+    with _lock:
+        pending = list(_pending)
+
+    wait(pending)
+
+    with _lock:
+        errors = list(_errors)
+        _errors.clear()
+
+    return errors
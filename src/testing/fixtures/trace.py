@@ -0,0 +1,166 @@
+"""
+Export of fixture lifecycles as trace spans.
+
+A Tracer (registered via add_observer(), e.g. by the pytest plugin's --fixture-trace
+and --fixture-trace-otel options) turns the setup and teardown of every fixture,
+including the fixtures entered by compose() and compose_noinject(), into nested
+spans.
+The plugin adds a span around each test body.
+
+- ChromeTracer appends trace events to a file in the Chrome trace event (JSON array)
+  format, viewable in chrome://tracing or https://ui.perfetto.dev.
+  Processes (e.g. xdist workers) append to the same file so each is shown as its own
+  track, with one row per thread (e.g. deferred teardown workers).
+- OtelTracer emits the spans through the OpenTelemetry API (the opentelemetry-api
+  package) to whatever tracer provider and exporter the process has configured.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from testing.fixtures import Observer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from testing.fixtures import Binding
+
+
+class Tracer(Observer, ABC):
+    """Observer emitting a span around each fixture setup and teardown."""
+
+    @abstractmethod
+    def begin(self, name: str, category: str) -> None:
+        """Begin a span (nested in the span currently open on this thread)."""
+
+    @abstractmethod
+    def end(self, name: str, category: str) -> None:
+        """End the span most recently begun on this thread."""
+
+    def setup_started(self, binding: Binding) -> None:
+        """Begin the setup span."""
+        self.begin(f"setup {binding.describe()}", "fixture")
+
+    def setup_finished(self, binding: Binding) -> None:
+        """End the setup span."""
+        self.end(f"setup {binding.describe()}", "fixture")
+
+    def teardown_started(self, binding: Binding) -> None:
+        """Begin the teardown span."""
+        self.begin(f"teardown {binding.describe()}", "fixture")
+
+    def teardown_finished(self, binding: Binding) -> None:
+        """End the teardown span."""
+        self.end(f"teardown {binding.describe()}", "fixture")
+
+
+class ChromeTracer(Tracer):
+    """Tracer appending Chrome trace events to a file (shared between processes)."""
+
+    def __init__(self, path: Path, track: str) -> None:
+        """Append events to path (which must exist) showing this process as track."""
+        self._lock = threading.Lock()
+        self._threads: set[int] = set()
+
+        # Events are written with a single write() each so that appends from several
+        # processes don't interleave
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+        self._write({"ph": "M", "name": "process_name", "args": {"name": track}})
+
+    @staticmethod
+    def create(path: Path) -> None:
+        """Create (or truncate) the trace file before any process appends to it."""
+        # The closing bracket is optional in the JSON array format
+        path.write_text("[\n", encoding="utf-8")
+
+    def begin(self, name: str, category: str) -> None:
+        """Write a begin event."""
+        self._event("B", name, category)
+
+    def end(self, name: str, category: str) -> None:
+        """Write an end event."""
+        self._event("E", name, category)
+
+    def close(self) -> None:
+        """Stop writing to the trace file."""
+        with self._lock:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _event(self, phase: str, name: str, category: str) -> None:
+        """Write a duration event for the current thread."""
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads.add(tid)
+            thread_name = threading.current_thread().name
+            self._write(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+
+        self._write(
+            {
+                "ph": phase,
+                "name": name,
+                "cat": category,
+                "ts": time.monotonic_ns() // 1000,  # System wide clock (in µs)
+                "tid": tid,
+            }
+        )
+
+    def _write(self, event: dict[str, Any]) -> None:
+        """Append an event of this process to the file."""
+        # Not cached since forked children (see forkserver) keep appending
+        line = json.dumps({"pid": os.getpid(), **event}) + ",\n"
+        with self._lock:
+            if self._fd != -1:
+                os.write(self._fd, line.encode())
+
+
+class OtelTracer(Tracer):
+    """Tracer emitting spans through the OpenTelemetry API."""
+
+    def __init__(self) -> None:
+        """Use the tracer of the globally configured tracer provider."""
+        try:
+            from opentelemetry import context, trace  # noqa: PLC0415
+        except ImportError as exc:
+            err_msg = "OtelTracer requires the opentelemetry-api package"
+            raise ImportError(err_msg) from exc
+
+        self._context = context
+        self._trace = trace
+        self._tracer = trace.get_tracer("testing.fixtures")
+        self._local = threading.local()
+
+    def begin(self, name: str, category: str) -> None:
+        """Start a span and make it current."""
+        span = self._tracer.start_span(name, attributes={"category": category})
+        token = self._context.attach(self._trace.set_span_in_context(span))
+        self._stack().append((span, token))
+
+    def end(self, name: str, category: str) -> None:  # noqa: ARG002
+        """End the current span and restore its parent."""
+        stack = self._stack()
+        if stack:
+            span, token = stack.pop()
+            self._context.detach(token)
+            span.end()
+
+    def _stack(self) -> list[tuple[Any, Any]]:
+        """Get the spans open on this thread."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+
+        stack: list[tuple[Any, Any]] = self._local.stack
+        return stack
@@ -1,11 +1,23 @@
 """Sub-package containing commonly used utility fixtures."""
 
+import http.client
+import mmap
 import os
+import signal
+import socket
+import subprocess
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, TemporaryFile, gettempdir
+from typing import IO, NamedTuple
 
 from testing.fixtures import FixtureDefinition, fixture
 
+# Directory (shared by the processes of a test run) holding shared buffers
+SHARED_DIR = Path(os.environ.get("FIXTURE_SHARED_DIR", gettempdir()))
+
 
 @fixture
 def create_temp_dir() -> FixtureDefinition[Path]:
@@ -14,7 +26,7 @@ def create_temp_dir() -> FixtureDefinition[Path]:
         yield Path(temp_dir)
 
 
-@fixture
+@fixture(global_state=True)
 def create_temp_cwd() -> FixtureDefinition[Path]:
     """Create a temporary directory and switch the cwd to it."""
     original_cwd = Path.cwd().absolute()
@@ -27,3 +39,193 @@ def create_temp_cwd() -> FixtureDefinition[Path]:
 
         finally:
             os.chdir(original_cwd)
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive (inter-process) lock on path (created if missing)."""
+    import fcntl  # noqa: PLC0415  # POSIX only so imported on use
+
+    while True:
+        lock = path.open("a")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        with suppress(FileNotFoundError):
+            if path.stat().st_ino == os.fstat(lock.fileno()).st_ino:
+                break
+        lock.close()  # Removed by its last user while we waited so try again
+
+    try:
+        yield
+    finally:
+        lock.close()  # Releases the lock
+
+
+def _add_ref(refs: Path, delta: int) -> int:
+    """Add delta to the reference count stored in refs (lock held) and return it."""
+    count = int(refs.read_text(encoding="ascii") or 0) if refs.exists() else 0
+    count += delta
+    refs.write_text(str(count), encoding="ascii")
+
+    return count
+
+
+@fixture(scope="session")
+def create_shared_buffer(
+    name: str, build: Callable[[], bytes | bytearray | memoryview]
+) -> FixtureDefinition[memoryview]:
+    """
+    Build a large buffer once and share it (read-only, zero-copy) between processes.
+
+    The first process of a test run (e.g. xdist worker) to set up the fixture calls
+    build() and writes the result to a file under SHARED_DIR which every process
+    memory-maps read-only, so the pages are shared rather than copied per worker.
+    The file is removed when the last process using it tears the fixture down.
+    Wrap the view with e.g. numpy.frombuffer() to use it as an array.
+    POSIX only (inter-process locking uses fcntl).
+    """
+    run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID", str(os.getpid()))
+    base = SHARED_DIR / f"testing-fixtures-{run_id}-{name}"
+    data, refs, lock = (
+        base.with_suffix(suffix) for suffix in (".bin", ".refs", ".lock")
+    )
+
+    with _locked(lock):
+        if not data.exists():
+            partial = base.with_suffix(".partial")
+            partial.write_bytes(build())
+            partial.rename(data)
+        _add_ref(refs, 1)
+
+    try:
+        with data.open("rb") as file:
+            if data.stat().st_size == 0:  # Empty files can't be memory-mapped
+                yield memoryview(b"")
+                return
+
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            with suppress(BufferError):  # Views still exported by the tests
+                mapped.close()
+
+    finally:
+        with _locked(lock):
+            if _add_ref(refs, -1) == 0:
+                data.unlink()
+                refs.unlink()
+                lock.unlink()
+
+
+class Service(NamedTuple):
+    """Service subprocess listening on a local port."""
+
+    process: subprocess.Popen[bytes]
+    host: str
+    port: int
+
+    @property
+    def url(self) -> str:
+        """Base URL of the service (over HTTP)."""
+        return f"http://{self.host}:{self.port}"
+
+
+def free_port(host: str = "127.0.0.1") -> int:
+    """Get an ephemeral port which is free (at the time of the call) on host."""
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        port: int = sock.getsockname()[1]
+
+    return port
+
+
+def _probe(host: str, port: int, ready_path: str | None) -> bool:
+    """Check whether the service accepts connections (and answers ready_path)."""
+    if ready_path is None:
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+        except OSError:
+            return False
+        return True
+
+    connection = http.client.HTTPConnection(host, port, timeout=1)
+    try:
+        connection.request("GET", ready_path)
+        status = connection.getresponse().status
+    except OSError:
+        return False
+    finally:
+        connection.close()
+
+    return status < 500  # noqa: PLR2004  # Server errors mean still starting up
+
+
+def _output(log: IO[bytes]) -> str:
+    """Get the tail of the output the service wrote to log."""
+    log.seek(0)
+    return log.read()[-4000:].decode(errors="replace")
+
+
+@fixture(scope="session")
+def run_service(  # noqa: PLR0913
+    command: Sequence[str],
+    *,
+    ready_path: str | None = None,
+    env: Mapping[str, str] | None = None,
+    host: str = "127.0.0.1",
+    startup_timeout: float = 30.0,
+    shutdown_timeout: float = 5.0,
+) -> FixtureDefinition[Service]:
+    """
+    Launch a service subprocess on an ephemeral port and wait until it is ready.
+
+    The port is passed to the service by formatting "{port}" in command and via the
+    PORT environment variable (added to env, or to the current environment).
+    Readiness is detected by connecting to the port (or by GET ready_path answering
+    without a server error), retried with a short exponential backoff, rather than
+    by sleeping for a fixed time.
+    A service exiting (or not getting ready within startup_timeout) during startup
+    raises RuntimeError with the tail of its output.
+    At teardown the service is sent SIGTERM and killed if it hasn't exited after
+    shutdown_timeout.
+    """
+    port = free_port(host)
+    argv = [arg.format(port=port) for arg in command]
+    environ = {**(os.environ if env is None else env), "PORT": str(port)}
+
+    with TemporaryFile() as log:
+        process = subprocess.Popen(  # noqa: S603
+            argv, env=environ, stdout=log, stderr=subprocess.STDOUT
+        )
+        try:
+            deadline = time.monotonic() + startup_timeout
+            delay = 0.001
+            while not _probe(host, port, ready_path):
+                if process.poll() is not None:
+                    err_msg = (
+                        f"Service {argv} exited with {process.returncode} during "
+                        f"startup:\n{_output(log)}"
+                    )
+                    raise RuntimeError(err_msg)
+                if time.monotonic() > deadline:
+                    err_msg = (
+                        f"Service {argv} not ready after {startup_timeout}s:\n"
+                        f"{_output(log)}"
+                    )
+                    raise RuntimeError(err_msg)
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+
+            yield Service(process, host, port)
+
+        finally:
+            if process.poll() is None:
+                process.send_signal(signal.SIGTERM)
+                try:
+                    process.wait(shutdown_timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
@@ -0,0 +1,60 @@
+"""Test fixtures whose teardown is deferred to a background worker."""
+
+import pytest
+
+from testing.fixtures import fixture, teardown
+
+from .utils import TORN_DOWN_T, Ti, fixture_c, fixture_t
+
+
+def test_teardown_runs_in_background() -> None:
+    """The teardown is queued and completes after the context has been exited."""
+    # GIVEN
+    TORN_DOWN_T.clear()
+
+    # WHEN
+    with fixture_t.set(Ti("slow"), delay=0.2) as t:
+        assert t == "slow"
+
+    # THEN
+    assert TORN_DOWN_T == []  # Still sleeping in the background
+
+    assert teardown.finish() == []
+    assert TORN_DOWN_T == ["slow"]
+
+
+def test_barrier_waits_for_pending_teardown() -> None:
+    """Re-entering a barrier fixture waits for its previous teardown to finish."""
+    # GIVEN
+    TORN_DOWN_T.clear()
+
+    with fixture_t.set(Ti("first"), delay=0.1):
+        pass
+
+    # WHEN
+    with fixture_t.set(Ti("second")):
+        # THEN
+        assert TORN_DOWN_T == ["first"]
+
+    teardown.finish()
+
+
+def test_teardown_errors_collected() -> None:
+    """Errors raised by deferred teardowns are reported by finish()."""
+    # GIVEN
+    with fixture_t.set(Ti("broken"), fail=True):
+        pass
+
+    # WHEN
+    errors = teardown.finish()
+
+    # THEN
+    assert len(errors) == 1
+    assert errors[0].fixture_name == "fixture_t"
+    assert "broken" in str(errors[0].error)
+
+
+def test_deferred_composed_fixture_rejected() -> None:
+    """Fixtures composing other fixtures can't defer their teardown."""
+    with pytest.raises(ValueError, match="composes other fixtures"):
+        fixture(deferred=True)(fixture_c.definition)
@@ -0,0 +1,59 @@
+"""Test remembering (and retrying) fixture setup failures."""
+
+import time
+
+import pytest
+
+from .utils import ATTEMPTS_R, FAIL_FAST_TTL, Ri, fixture_r
+
+
+def test_failure_remembered() -> None:
+    """A failing setup is retried then re-raised without running again."""
+    # GIVEN
+    ATTEMPTS_R.clear()
+
+    @fixture_r.set(Ri("db"), fail=True)
+    def test(r: Ri) -> None:
+        """Test using the broken fixture."""
+
+    # WHEN
+    with pytest.raises(ConnectionError) as first:
+        test()
+    with pytest.raises(ConnectionError) as second:
+        test()
+
+    # THEN
+    assert ATTEMPTS_R == ["db", "db"]  # One retry and then remembered
+    assert second.value is first.value
+
+
+def test_failure_keyed_by_args() -> None:
+    """Failures are only remembered for the (kw)args they happened with."""
+    # GIVEN
+    ATTEMPTS_R.clear()
+
+    with pytest.raises(ConnectionError), fixture_r.set(Ri("down"), fail=True):
+        pass
+
+    # WHEN
+    with fixture_r.set(Ri("up")) as r:
+        # THEN
+        assert r == "up"
+
+
+def test_failure_expires() -> None:
+    """Setup is attempted again once the remembered failure expired."""
+    # GIVEN
+    ATTEMPTS_R.clear()
+
+    with pytest.raises(ConnectionError), fixture_r.set(Ri("flaky"), fail=True):
+        pass
+
+    # WHEN
+    time.sleep(FAIL_FAST_TTL)
+
+    with pytest.raises(ConnectionError), fixture_r.set(Ri("flaky"), fail=True):
+        pass
+
+    # THEN
+    assert ATTEMPTS_R == ["flaky"] * 4
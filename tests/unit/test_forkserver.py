@@ -0,0 +1,61 @@
+"""Test running tests in children forked from warmed session fixtures."""
+
+import pytest
+
+from testing.fixtures import forkserver
+
+pytest_plugins = ["pytester"]
+
+SUITE = """
+import os
+
+from testing.fixtures import FixtureDefinition, fixture
+
+SETUP_PIDS = []
+
+
+@fixture(scope="session")
+def warmed() -> FixtureDefinition[int]:
+    SETUP_PIDS.append(os.getpid())
+    yield os.getpid()
+
+
+@fixture
+def per_test() -> FixtureDefinition[int]:
+    yield os.getpid()
+
+
+@per_test
+@warmed
+def test_a(warmed: int, per_test: int) -> None:
+    assert warmed != per_test  # Set up by the parent, used in the child
+
+
+@per_test
+@warmed
+def test_b(warmed: int, per_test: int) -> None:
+    assert warmed != per_test
+    assert SETUP_PIDS == [warmed]  # Inherited without setting up again
+
+
+def test_fails() -> None:
+    assert False
+
+
+def test_crashes() -> None:
+    os._exit(3)
+"""
+
+
+@pytest.mark.skipif(not forkserver.available, reason="requires os.fork()")
+def test_fixture_fork(pytester: pytest.Pytester) -> None:
+    """Tests run in forked children sharing the session fixtures set up once."""
+    # GIVEN
+    pytester.makepyfile(SUITE)
+
+    # WHEN
+    result = pytester.runpytest_subprocess("--fixture-fork")
+
+    # THEN
+    result.assert_outcomes(passed=2, failed=2)
+    result.stdout.fnmatch_lines(["*forked child running the test crashed*"])
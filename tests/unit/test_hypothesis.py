@@ -0,0 +1,76 @@
+"""Test reusing fixtures across the examples generated by Hypothesis."""
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+
+from hypothesis import settings, strategies  # noqa: E402
+
+from testing.fixtures import integrity  # noqa: E402
+from testing.fixtures.hypothesis import examples  # noqa: E402
+
+from .utils import SETUPS_X, Xo, fixture_x  # noqa: E402
+
+EXAMPLES = 20
+
+
+def test_fixture_reused_across_examples() -> None:
+    """The fixture is set up once and reset (not leaking state) between examples."""
+    # GIVEN
+    SETUPS_X.update(count=0, resets=0)
+    calls = []
+
+    @settings(max_examples=EXAMPLES, database=None)
+    @examples(fixture_x, key=strategies.text(min_size=1))
+    def test(store: Xo, key: str) -> None:
+        """Property using the store."""
+        calls.append(key)
+        assert list(store) == ["capacity"]
+        store[key] = 1
+
+    # WHEN
+    test()
+
+    # THEN
+    assert len(calls) >= EXAMPLES
+    assert SETUPS_X["count"] == 1
+    assert SETUPS_X["resets"] == len(calls)  # After every example (incl. the last)
+
+
+def test_fixture_args_drawn() -> None:
+    """Drawn fixture (kw)args are set on the fixture (set up again when they change)."""
+    # GIVEN
+    SETUPS_X.update(count=0, resets=0)
+    capacities = []
+
+    @settings(max_examples=EXAMPLES, database=None)
+    @examples(fixture_x, capacity=strategies.integers(1, 3))
+    def test(store: Xo) -> None:
+        """Property using the store with drawn capacity."""
+        capacities.append(store["capacity"])
+
+    # WHEN
+    test()
+
+    # THEN
+    assert set(capacities) == {1, 2, 3}
+    assert SETUPS_X["resets"] == len(capacities)  # After every example
+
+
+def test_guarded_fixture_reset_between_examples() -> None:
+    """With the guard enabled examples may mutate a value their reset hook restores."""
+
+    # GIVEN
+    @settings(max_examples=EXAMPLES, database=None)
+    @examples(fixture_x, key=strategies.text(min_size=1))
+    def test(store: Xo, key: str) -> None:
+        """Property mutating the store."""
+        store[key] = 1
+
+    integrity.enable()
+    try:
+        # WHEN / THEN (doesn't raise FixtureMutatedError)
+        test()
+
+    finally:
+        integrity.enable(flag=False)
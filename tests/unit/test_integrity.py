@@ -0,0 +1,100 @@
+"""Test guarding shared fixture values against mutation by tests."""
+
+import threading
+
+import pytest
+
+from testing.fixtures import FixtureDefinition, fixture, integrity
+from testing.fixtures.integrity import FixtureMutatedError
+
+from .utils import SETUPS_U, Uo, fixture_u
+
+SEEN: list[list[int]] = []
+
+
+@fixture_u
+def read_items(value: Uo) -> None:
+    """Only read the value."""
+    SEEN.append(list(value["items"]))
+
+
+@fixture_u
+def append_item(value: Uo) -> None:
+    """Mutate the value."""
+    value["items"].append(4)
+
+
+def test_unchanged_value_shared() -> None:
+    """A value which isn't mutated is reused by the next test."""
+    # GIVEN
+    fixture_u.close()
+    SETUPS_U.clear()
+
+    # WHEN
+    read_items()
+    read_items()
+
+    # THEN
+    assert len(SETUPS_U) == 1
+    fixture_u.close()
+
+
+def test_mutation_fails_test() -> None:
+    """The mutating test fails and the next test gets a fresh value."""
+    # GIVEN
+    fixture_u.close()
+    SETUPS_U.clear()
+
+    # WHEN
+    with pytest.raises(FixtureMutatedError, match="fixture_u"):
+        append_item()
+
+    read_items()
+
+    # THEN
+    assert len(SETUPS_U) == 2  # noqa: PLR2004
+    assert SEEN[-1] == [1, 2, 3]
+    fixture_u.close()
+
+
+def test_enable_guards_all_fixtures() -> None:
+    """Once enabled unguarded fixtures are guarded too."""
+
+    # GIVEN
+    @fixture
+    def unguarded() -> FixtureDefinition[list[int]]:
+        """Yield a mutable value."""
+        yield []
+
+    integrity.enable()
+    try:
+        # WHEN / THEN
+        with pytest.raises(FixtureMutatedError), unguarded as value:
+            value.append(1)
+
+    finally:
+        integrity.enable(flag=False)
+
+
+class Holder:
+    """Unpicklable value (holds a lock)."""
+
+    def __init__(self) -> None:
+        """Hold a lock and some state."""
+        self.lock = threading.Lock()
+        self.state = {"count": 0}
+
+
+def test_fingerprint_unpicklable() -> None:
+    """Values which can't be pickled are fingerprinted by walking their attributes."""
+    # GIVEN
+    holder = Holder()
+    before = integrity.fingerprint(holder)
+
+    # WHEN
+    unchanged = integrity.fingerprint(holder)
+    holder.state["count"] += 1
+
+    # THEN
+    assert unchanged == before
+    assert integrity.fingerprint(holder) != before
@@ -0,0 +1,60 @@
+"""Test lazy fixtures which are only set up when their value is accessed."""
+
+import pytest
+
+from testing.fixtures import Lazy, lazy
+
+from .utils import VALUE_E, Bi1, Bi2, Bo, Eo, fixture_b, fixture_e
+
+
+@lazy(fixture_e)
+def test_lazy_not_accessed(e: Lazy[Eo]) -> None:
+    """The fixture is not set up if its value is never accessed."""
+    assert not e.is_set_up
+    assert VALUE_E["value"] == 0
+
+
+@lazy(fixture_e)
+def test_lazy_accessed(e: Lazy[Eo]) -> None:
+    """The fixture is set up on first access and the value is reused afterwards."""
+    assert e.value == 1
+    assert e.value == 1
+    assert e.is_set_up
+    assert VALUE_E["value"] == 1
+
+
+@lazy(fixture_b.set(Bi1(7), Bi2(0.5)))
+def test_lazy_set(b: Lazy[Bo]) -> None:
+    """Lazy fixtures use the (kw)args set at the decoration site."""
+    assert b.value == {"b1": 7, "b2": 0.5}
+
+
+def test_lazy_teardown() -> None:
+    """The teardown runs after the test if the value was accessed."""
+
+    # GIVEN
+    @lazy(fixture_e)
+    def test_access(e: Lazy[Eo]) -> None:
+        """Access the value."""
+        assert e.value == 1
+
+    # WHEN
+    test_access()
+
+    # THEN
+    assert VALUE_E["value"] == 0
+
+
+def test_lazy_not_accessed_exception() -> None:
+    """Exceptions raised by the test propagate when the fixture was never set up."""
+
+    # GIVEN
+    @lazy(fixture_e)
+    def test_raises(e: Lazy[Eo]) -> None:
+        """Fail without accessing the value."""
+        assert not e.is_set_up
+        raise ValueError("boom")  # noqa: EM101
+
+    # WHEN / THEN
+    with pytest.raises(ValueError, match="boom"):
+        test_raises()
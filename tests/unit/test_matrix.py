@@ -0,0 +1,115 @@
+"""Test running a test across a matrix of fixture (kw)args."""
+
+import pytest
+
+from testing.fixtures import MATRIX_CELL
+
+from .utils import SETUPS_M, Mi, Mo, fixture_m
+
+pytest_plugins = ["pytester"]
+
+DESELECTED_SUITE = """
+from testing.fixtures import FixtureDefinition, compose, fixture
+
+
+@fixture
+def base(name: str) -> FixtureDefinition[str]:
+    yield name
+
+
+@fixture
+@compose(base.set("matrix"))
+def cell(base: str, number: int) -> FixtureDefinition[tuple[str, int]]:
+    yield (base, number)
+
+
+@cell.matrix([(1,), (2,), (3,)])
+def test_cells(cell: tuple[str, int]) -> None:
+    assert cell[0] == "matrix"
+
+
+@base.set("other")
+def test_later(base: str) -> None:
+    assert base == "other"
+"""
+
+
+@fixture_m.matrix([(Mi(1),), (Mi(2),), {"m": Mi(3)}])
+def test_matrix(m: tuple[Mo, Mi]) -> None:
+    """Run once per cell (generated by the pytest plugin)."""
+    assert m[1] in {1, 2, 3}
+
+
+def test_matrix_shares_composed_fixtures() -> None:
+    """Composed fixtures are set up once across all cells and then torn down."""
+    # GIVEN
+    values = []
+
+    @fixture_m.matrix([(Mi(4),), (Mi(5),)], ids=["four", "five"])
+    def test(m: tuple[Mo, Mi]) -> None:
+        """Record the value injected for each cell."""
+        values.append(m)
+
+    count = SETUPS_M["count"]
+
+    # WHEN
+    for cell in range(2):
+        test(**{MATRIX_CELL: cell})
+
+    # THEN
+    assert SETUPS_M["count"] == count + 1
+    assert values == [(count + 1, 4), (count + 1, 5)]
+    assert SETUPS_M["live"] == 0
+
+
+def test_matrix_failing_cell() -> None:
+    """A failing cell tears down the shared fixtures and the next cell starts afresh."""
+
+    # GIVEN
+    @fixture_m.matrix([(Mi(6),), (Mi(7),)])
+    def test(m: tuple[Mo, Mi]) -> None:
+        """Fail for the first cell."""
+        if m[1] == Mi(6):
+            raise ValueError("boom")  # noqa: EM101
+
+    count = SETUPS_M["count"]
+
+    # WHEN
+    with pytest.raises(ValueError, match="boom"):
+        test(**{MATRIX_CELL: 0})
+
+    test(**{MATRIX_CELL: 1})
+
+    # THEN
+    assert SETUPS_M["count"] == count + 2
+    assert SETUPS_M["live"] == 0
+
+
+def test_matrix_parallel() -> None:
+    """With parallel=True composed fixtures are set up per cell."""
+
+    # GIVEN
+    @fixture_m.matrix([(Mi(8),), (Mi(9),)], parallel=True)
+    def test(m: tuple[Mo, Mi]) -> None:
+        """Do nothing."""
+
+    count = SETUPS_M["count"]
+
+    # WHEN
+    for cell in range(2):
+        test(**{MATRIX_CELL: cell})
+
+    # THEN
+    assert SETUPS_M["count"] == count + 2
+
+
+def test_matrix_deselected_cell(pytester: pytest.Pytester) -> None:
+    """Shared fixtures are closed after the last cell run when others are deselected."""
+    # GIVEN
+    pytester.makepyfile(test_suite=DESELECTED_SUITE)
+
+    # WHEN
+    result = pytester.runpytest_subprocess("--deselect", "test_suite.py::test_cells[3]")
+
+    # THEN
+    result.assert_outcomes(passed=3, deselected=1)
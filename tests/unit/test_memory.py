@@ -0,0 +1,111 @@
+"""Test that fixture values are released promptly after the fixture is exited."""
+
+import gc
+import time
+import tracemalloc
+import weakref
+
+from testing.fixtures import FixtureDefinition, fixture, leaks, teardown
+
+from .utils import BIG_SIZE, BigPayload, fixture_big
+
+KEPT: list[BigPayload] = []
+
+
+def test_value_released_after_exit() -> None:
+    """The fixture drops its references to the value and generator on the last exit."""
+    # GIVEN
+    with fixture_big as payload:
+        ref = weakref.ref(payload)
+
+    # WHEN
+    del payload
+
+    # THEN
+    assert ref() is None
+    assert not hasattr(fixture_big, "_value")
+    assert not hasattr(fixture_big, "_generator")
+
+
+def test_big_payload_memory_regression() -> None:
+    """Memory allocated by a big payload fixture is returned after the test."""
+    # GIVEN
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    # WHEN
+    @fixture_big
+    def test(payload: BigPayload) -> None:
+        """Use the big payload."""
+        assert len(payload) == BIG_SIZE
+
+    test()
+
+    # THEN
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak - baseline >= BIG_SIZE
+    assert current - baseline < BIG_SIZE // 100
+
+
+def test_leak_report() -> None:
+    """Values kept alive after their fixture has been exited are reported."""
+    # GIVEN
+    enabled = leaks.enabled
+    leaks.enable()
+
+    # WHEN
+    try:
+        with fixture_big.set(16) as payload:
+            KEPT.append(payload)
+
+        with fixture_big.set(16):
+            pass
+
+        leaked = leaks.collect()
+    finally:
+        leaks.enable(enabled)
+        KEPT.clear()
+
+    # THEN
+    assert leaked == [leaks.Leak("fixture_big", "BigPayload")]
+
+
+def test_deferred_value_not_reported_as_leak() -> None:
+    """Values of deferred fixtures are only watched once the teardown has run."""
+
+    # GIVEN
+    @fixture(deferred=True)
+    def slow(keep: bool = False) -> FixtureDefinition[BigPayload]:
+        """Yield a payload and tear down slowly in the background."""
+        payload = BigPayload(16)
+        if keep:
+            KEPT.append(payload)
+        yield payload
+        time.sleep(0.1)
+
+    enabled = leaks.enabled
+    leaks.enable()
+
+    # WHEN
+    try:
+        with slow:
+            pass
+        during_teardown = leaks.collect()
+        assert teardown.finish() == []
+        released = leaks.collect()
+
+        with slow.set(keep=True):
+            pass
+        assert teardown.finish() == []
+        kept = leaks.collect()
+    finally:
+        leaks.enable(enabled)
+        KEPT.clear()
+
+    # THEN
+    assert during_teardown == []
+    assert released == []
+    assert kept == [leaks.Leak("slow", "BigPayload")]
@@ -0,0 +1,155 @@
+"""Test the observer hooks and per-fixture memory accounting."""
+
+import time
+import tracemalloc
+
+from testing.fixtures import (
+    Binding,
+    FixtureDefinition,
+    Observer,
+    add_observer,
+    fixture,
+    remove_observer,
+    teardown,
+)
+from testing.fixtures.memory import MemoryAccountant
+
+from .utils import BIG_SIZE, fixture_big
+
+RETAINED: list[bytearray] = []
+
+
+@fixture
+def fixture_retaining(size: int) -> FixtureDefinition[None]:
+    """Leave a bytearray of given size behind in a module global."""
+    RETAINED.append(bytearray(size))
+    yield
+
+
+class Recorder(Observer):
+    """Record the events notified."""
+
+    def __init__(self) -> None:
+        """Create recorder with no events."""
+        self.events: list[tuple[str, str]] = []
+
+    def setup_started(self, binding: Binding) -> None:
+        """Record event."""
+        self.events.append(("setup_started", binding.describe()))
+
+    def setup_finished(self, binding: Binding) -> None:
+        """Record event."""
+        self.events.append(("setup_finished", binding.describe()))
+
+    def teardown_started(self, binding: Binding) -> None:
+        """Record event."""
+        self.events.append(("teardown_started", binding.describe()))
+
+    def teardown_finished(self, binding: Binding) -> None:
+        """Record event."""
+        self.events.append(("teardown_finished", binding.describe()))
+
+
+def test_observer_notified() -> None:
+    """Observers are notified around setup and teardown with the bound (kw)args."""
+    # GIVEN
+    recorder = Recorder()
+    add_observer(recorder)
+
+    # WHEN
+    try:
+        with fixture_retaining.set(8):
+            recorder.events.append(("test", ""))
+    finally:
+        remove_observer(recorder)
+        RETAINED.clear()
+
+    # THEN
+    assert recorder.events == [
+        ("setup_started", "fixture_retaining(8)"),
+        ("setup_finished", "fixture_retaining(8)"),
+        ("test", ""),
+        ("teardown_started", "fixture_retaining(8)"),
+        ("teardown_finished", "fixture_retaining(8)"),
+    ]
+
+
+def test_memory_attributed_to_fixtures() -> None:
+    """Retained memory is attributed to the fixture (and args) that left it behind."""
+    # GIVEN
+    accountant = MemoryAccountant()
+    add_observer(accountant)
+    tracing = tracemalloc.is_tracing()  # e.g. by --fixture-memory
+    tracemalloc.start()
+
+    # WHEN
+    try:
+        with fixture_big:
+            pass
+        with fixture_retaining.set(BIG_SIZE):
+            pass
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+        remove_observer(accountant)
+        RETAINED.clear()
+
+    # THEN
+    retaining, big = accountant.report(top=2)
+
+    assert retaining.name == f"fixture_retaining({BIG_SIZE})"
+    assert retaining.retained_bytes >= BIG_SIZE
+    assert big.name == "fixture_big()"
+    assert big.setup_bytes >= BIG_SIZE
+    assert big.retained_bytes < BIG_SIZE // 100
+
+
+def test_memory_kept_by_test_not_attributed() -> None:
+    """Memory kept by the test (between setup and teardown) isn't blamed on fixtures."""
+    # GIVEN
+    accountant = MemoryAccountant()
+    add_observer(accountant)
+    tracing = tracemalloc.is_tracing()
+    tracemalloc.start()
+
+    # WHEN
+    try:
+        with fixture_retaining.set(0):
+            RETAINED.append(bytearray(BIG_SIZE))  # Kept by the test
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+        remove_observer(accountant)
+        RETAINED.clear()
+
+    # THEN
+    (retaining,) = accountant.report()
+    assert retaining.retained_bytes < BIG_SIZE // 100
+
+
+def test_overlapping_deferred_teardown_accounted() -> None:
+    """A deferred teardown finishing after the next setup is accounted to its own."""
+
+    # GIVEN
+    @fixture(deferred=True)
+    def slow_teardown() -> FixtureDefinition[None]:
+        """Fixture whose teardown outlasts the next setup."""
+        yield
+        time.sleep(0.1)
+
+    accountant = MemoryAccountant()
+    add_observer(accountant)
+
+    # WHEN
+    try:
+        with slow_teardown:
+            pass
+        with slow_teardown:
+            pass
+        assert teardown.finish() == []
+    finally:
+        remove_observer(accountant)
+
+    # THEN
+    (stats,) = accountant.report()
+    assert stats.setups == 2  # noqa: PLR2004
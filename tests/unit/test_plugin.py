@@ -0,0 +1,120 @@
+"""Test the pytest plugin's fixture affinity ordering."""
+
+import pytest
+
+from testing.fixtures import get_bindings
+from testing.fixtures.plugin import get_affinity, order_by_affinity
+
+from .utils import Ao, Bi1, Bi2, Bo, Si, So, fixture_a, fixture_b, fixture_s
+
+pytest_plugins = ["pytester"]
+
+AFFINITY_SUITE = """
+import os
+from pathlib import Path
+
+import pytest
+
+from testing.fixtures import FixtureDefinition, fixture
+
+RECORD = Path({record!r})
+
+
+@fixture(scope="session")
+def shared(name: str) -> FixtureDefinition[str]:
+    yield name
+
+
+@pytest.mark.parametrize("index", range(8))
+@shared.set("left")
+def test_left(shared: str, index: int) -> None:
+    with RECORD.open("a") as record:
+        record.write(f"{{shared}} {{os.environ['PYTEST_XDIST_WORKER']}}\\n")
+
+
+@pytest.mark.parametrize("index", range(8))
+@shared.set("right")
+def test_right(shared: str, index: int) -> None:
+    with RECORD.open("a") as record:
+        record.write(f"{{shared}} {{os.environ['PYTEST_XDIST_WORKER']}}\\n")
+"""
+
+
+def test_bindings_recorded() -> None:
+    """Decorating a test records the fixtures (and their args) bound to it."""
+
+    # WHEN
+    @fixture_b.set(Bi1(1), Bi2(2.0))
+    @fixture_a
+    def test(a: Ao, b: Bo) -> None:
+        """Test with two fixtures."""
+
+    # THEN
+    bindings = get_bindings(test)
+    assert [binding.fixture for binding in bindings] == [fixture_b, fixture_a]
+    assert bindings[0].args == (1, 2.0)
+
+
+def test_affinity_of_session_fixtures() -> None:
+    """Only session scoped fixtures (and their args) contribute to affinity."""
+
+    # GIVEN
+    @fixture_s.set(Si(7))
+    @fixture_a
+    def test_7(a: Ao, s: So) -> None:
+        """Test using fixture_s with 7."""
+
+    @fixture_s.set(Si(8))
+    def test_8(s: So) -> None:
+        """Test using fixture_s with 8."""
+
+    @fixture_a
+    def test_none(a: Ao) -> None:
+        """Test using no session scoped fixture."""
+
+    # WHEN
+    affinity_7 = get_affinity(test_7)
+
+    # THEN
+    assert affinity_7 == frozenset({(id(fixture_s), "fixture_s(7)")})
+    assert affinity_7 != get_affinity(test_8)
+    assert get_affinity(test_none) == frozenset()
+
+
+def test_order_by_affinity() -> None:
+    """Tests sharing an affinity are grouped, free tests keep their order in front."""
+    # GIVEN
+    x = frozenset({(1, "x")})
+    y = frozenset({(2, "y")})
+    xy = x | y
+    affinities = [x, frozenset(), y, xy, x, frozenset(), y]
+
+    # WHEN
+    groups = order_by_affinity(affinities)
+
+    # THEN
+    assert groups == [[1, 5], [0, 4], [3], [2, 6]]
+
+
+def test_affinity_groups_on_one_worker(pytester: pytest.Pytester) -> None:
+    """With --dist loadgroup the tests sharing a session fixture run on one worker."""
+    pytest.importorskip("xdist")
+
+    # GIVEN
+    record = pytester.path / "record.txt"
+    pytester.makepyfile(test_suite=AFFINITY_SUITE.format(record=str(record)))
+
+    # WHEN
+    result = pytester.runpytest_subprocess(
+        "-n", "2", "--dist", "loadgroup", "--fixture-affinity"
+    )
+
+    # THEN
+    result.assert_outcomes(passed=16)
+
+    workers: dict[str, set[str]] = {}
+    for line in record.read_text(encoding="utf-8").splitlines():
+        name, worker = line.split()
+        workers.setdefault(name, set()).add(worker)
+    assert workers.keys() == {"left", "right"}
+    assert all(len(used) == 1 for used in workers.values())
@@ -0,0 +1,99 @@
+"""Test prefetching of fixture setup in the background."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from testing.fixtures import FixtureDefinition, fixture, teardown
+from testing.fixtures.plugin import get_prefetchable
+from testing.fixtures.utils import create_temp_cwd
+
+from .utils import (
+    Ao,
+    Co,
+    Eo,
+    Si,
+    So,
+    fixture_a,
+    fixture_c,
+    fixture_e,
+    fixture_s,
+)
+
+
+def test_prefetched_value_taken_over() -> None:
+    """Entering with the prefetched (kw)args takes over the value set up earlier."""
+    # GIVEN
+    with ThreadPoolExecutor() as executor:
+        fixture_e.prefetch(executor)
+
+    # WHEN
+    with fixture_e as e:
+        # THEN
+        assert e == 1
+        assert fixture_e._prefetched is None
+
+
+def test_prefetch_discarded() -> None:
+    """A prefetched value that is never taken over is torn down when discarded."""
+    # GIVEN
+    with ThreadPoolExecutor() as executor:
+        fixture_e.prefetch(executor)
+
+    # WHEN
+    fixture_e.discard_prefetch()
+
+    # THEN
+    with fixture_e as e:
+        assert e == 1  # The prefetched setup (incrementing the value) was undone
+
+
+def test_prefetch_waits_for_barrier() -> None:
+    """A barrier fixture's prefetched setup starts after its pending teardown."""
+    # GIVEN
+    events = []
+
+    @fixture(deferred=True, barrier=True)
+    def slow_teardown(name: str) -> FixtureDefinition[str]:
+        """Fixture recording its setup and (slow) teardown."""
+        events.append(f"setup {name}")
+        yield name
+        time.sleep(0.1)
+        events.append(f"teardown {name}")
+
+    with slow_teardown.set("first"):
+        pass
+
+    # WHEN
+    with ThreadPoolExecutor() as executor:
+        slow_teardown.set("second").prefetch(executor)
+
+    # THEN
+    assert events == ["setup first", "teardown first", "setup second"]
+
+    with slow_teardown.set("second") as value:
+        assert value == "second"
+    assert teardown.finish() == []
+
+
+def test_prefetchable_bindings() -> None:
+    """Global state, composing, session scoped, and busy fixtures are not prefetched."""
+
+    # GIVEN
+    @fixture_a
+    @fixture_c
+    @fixture_s.set(Si(0))
+    @create_temp_cwd
+    @fixture_e
+    def test_next(e: Eo, cwd: Path, s: So, c: Co, a: Ao) -> None:
+        """Test using a mix of fixtures."""
+
+    @fixture_a
+    def test_running(a: Ao) -> None:
+        """Test using fixture_a."""
+
+    # WHEN
+    prefetchable = get_prefetchable(test_next, test_running)
+
+    # THEN
+    assert [binding.fixture for binding in prefetchable] == [fixture_e]
@@ -0,0 +1,63 @@
+"""Test the standalone runner."""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from testing.fixtures import run
+from testing.fixtures.utils import create_temp_dir
+
+SUITE = """
+from testing.fixtures import FixtureDefinition, fixture
+
+
+@fixture
+def number() -> FixtureDefinition[int]:
+    yield 7
+
+
+@number
+def test_passes(n: int) -> None:
+    assert n == 7
+
+
+@number.matrix([(), ()], ids=["first", "second"])
+def test_cells(n: int) -> None:
+    assert n == 7
+
+
+def test_fails() -> None:
+    assert False, "expected"
+
+
+def test_needs_argument(tmp_path) -> None:
+    pass
+"""
+
+
+@create_temp_dir
+def test_run(temp_dir: Path) -> None:
+    """Decorated tests are discovered, run, and reported as JUnit XML."""
+    # GIVEN
+    package = temp_dir / "runner_suite"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    (package / "test_suite.py").write_text(SUITE, encoding="utf-8")
+    report = temp_dir / "junit.xml"
+
+    # WHEN
+    exit_code = run.main([str(package), "--junit-xml", str(report)])
+
+    # THEN
+    assert exit_code == 1
+
+    cases = {
+        case.get("name"): [child.tag for child in case]
+        for case in ET.parse(report).getroot().iter("testcase")  # noqa: S314
+    }
+    assert cases == {
+        "test_passes": [],
+        "test_cells[first]": [],
+        "test_cells[second]": [],
+        "test_fails": ["failure"],
+        "test_needs_argument": ["skipped"],
+    }
@@ -0,0 +1,80 @@
+"""Test session scoped fixtures."""
+
+import pytest
+
+from .utils import SETUPS_S, Si, So, fixture_s
+
+
+def test_session_value_reused() -> None:
+    """A session scoped fixture is set up once for consecutive uses with same args."""
+    # GIVEN
+    fixture_s.close()
+    count = SETUPS_S["count"]
+
+    # WHEN
+    with fixture_s.set(Si(1)) as first:
+        pass
+
+    with fixture_s.set(Si(1)) as second:
+        pass
+
+    # THEN
+    assert first == second == 1
+    assert SETUPS_S["count"] == count + 1
+    assert SETUPS_S["live"] == 1  # Not torn down after the last exit
+
+    fixture_s.close()
+    assert SETUPS_S["live"] == 0
+
+
+def test_session_args_change() -> None:
+    """Changing the (kw)args tears down the live value and sets up a new one."""
+    # GIVEN
+    with fixture_s.set(Si(2)):
+        pass
+
+    # WHEN
+    with fixture_s.set(Si(3)) as value:
+        # THEN
+        assert value == So(3)
+        assert SETUPS_S["live"] == 1
+
+    fixture_s.close()
+
+
+def test_session_reentered_with_other_args() -> None:
+    """The live value is kept for the (kw)args it was set up with, not the last set."""
+    # GIVEN
+    fixture_s.close()
+
+    with fixture_s.set(Si(6)), fixture_s.set(Si(7)) as reentered:
+        assert reentered == So(6)  # Reentrance shares the outer value
+
+    # WHEN
+    with fixture_s.set(Si(7)) as value:
+        # THEN
+        assert value == So(7)
+
+    fixture_s.close()
+    assert SETUPS_S["live"] == 0
+
+
+def test_session_survives_test_failure() -> None:
+    """An exception raised inside the context does not tear down the live value."""
+    # GIVEN
+    fixture_s.close()
+
+    # WHEN
+    with pytest.raises(ValueError, match="boom"), fixture_s.set(Si(4)):
+        raise ValueError("boom")  # noqa: EM101
+
+    # THEN
+    assert SETUPS_S["live"] == 1
+    fixture_s.close()
+    assert SETUPS_S["live"] == 0
+
+
+@fixture_s.set(Si(5))
+def test_session_decorator(s: So) -> None:
+    """Session scoped fixtures decorate tests like any other fixture."""
+    assert s == So(5)
@@ -0,0 +1,80 @@
+"""Test exporting fixture lifecycles as trace spans."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from testing.fixtures import add_observer, remove_observer
+from testing.fixtures.trace import ChromeTracer, Tracer
+from testing.fixtures.utils import create_temp_dir
+
+from .utils import Ao, Bi1, Bi2, Bo, Co, fixture_a, fixture_b, fixture_c
+
+
+def _spans(path: Path) -> list[tuple[str, str]]:
+    """Load the (phase, name) of the duration events of a trace file."""
+    events = json.loads(path.read_text(encoding="utf-8").rstrip(",\n") + "]")
+    return [(event["ph"], event["name"]) for event in events if event["ph"] != "M"]
+
+
+@create_temp_dir
+def test_chrome_trace(temp_dir: Path) -> None:
+    """Setups and teardowns (including of composed fixtures) are nested spans."""
+    # GIVEN
+    path = temp_dir / "trace.json"
+    ChromeTracer.create(path)
+    tracer = ChromeTracer(path, "main")
+    add_observer(tracer)
+
+    @fixture_b.set(Bi1(1), Bi2(2.0))
+    @fixture_a
+    def test(a: Ao, b: Bo) -> None:
+        """Test with two fixtures."""
+
+    @fixture_c
+    def test_composed(c: Co) -> None:
+        """Test with a fixture composing fixture_b."""
+
+    # WHEN
+    try:
+        test()
+        test_composed()
+    finally:
+        remove_observer(tracer)
+        tracer.close()
+
+    # THEN
+    assert _spans(path) == [
+        ("B", "setup fixture_b(1, 2.0)"),
+        ("E", "setup fixture_b(1, 2.0)"),
+        ("B", "setup fixture_a()"),
+        ("E", "setup fixture_a()"),
+        ("B", "teardown fixture_a()"),
+        ("E", "teardown fixture_a()"),
+        ("B", "teardown fixture_b(1, 2.0)"),
+        ("E", "teardown fixture_b(1, 2.0)"),
+        ("B", "setup fixture_c()"),
+        ("B", "setup fixture_b(13, 1.44)"),
+        ("E", "setup fixture_b(13, 1.44)"),
+        ("E", "setup fixture_c()"),
+        ("B", "teardown fixture_c()"),
+        ("B", "teardown fixture_b(13, 1.44)"),
+        ("E", "teardown fixture_b(13, 1.44)"),
+        ("E", "teardown fixture_c()"),
+    ]
+
+
+def test_tracer_requires_spans() -> None:
+    """A Tracer subclass must implement both begin() and end()."""
+
+    # GIVEN
+    class BeginOnly(Tracer):
+        """Tracer missing end()."""
+
+        def begin(self, name: str, category: str) -> None:
+            """Do nothing."""
+
+    # WHEN / THEN
+    with pytest.raises(TypeError, match="end"):
+        BeginOnly()  # type: ignore[abstract]
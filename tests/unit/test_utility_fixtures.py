@@ -1,9 +1,16 @@
 """Unit tests for utility fixtures."""
 
+import sys
+import urllib.request
+from http import HTTPStatus
 from pathlib import Path
 
+import pytest
+
 import testing.fixtures.utils as sut
 
+SIZE = 3000
+
 
 @sut.create_temp_dir
 def test_create_temp_dir(temp_dir: Path) -> None:
@@ -19,3 +26,68 @@ def test_create_temp_cwd(cwd: Path) -> None:
     # THEN
     assert cwd.samefile(Path.cwd())
     assert "tmp" in str(cwd)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX only (uses fcntl)")
+def test_create_shared_buffer() -> None:
+    """The buffer is built once, mapped read-only, and removed after the last user."""
+    # GIVEN
+    builds = []
+
+    def build() -> bytes:
+        """Build the buffer."""
+        builds.append(1)
+        return b"abc" * (SIZE // 3)
+
+    # WHEN
+    with sut.create_shared_buffer.set("unit", build) as buffer:
+        files = list(sut.SHARED_DIR.glob("testing-fixtures-*-unit.*"))
+
+        # THEN
+        assert bytes(buffer[:6]) == b"abcabc"
+        assert len(buffer) == SIZE
+        assert buffer.readonly
+        assert {file.suffix for file in files} == {".bin", ".refs", ".lock"}
+
+    # Session scoped: the live value is reused
+    with sut.create_shared_buffer.set("unit", build) as buffer:
+        assert len(buffer) == SIZE
+
+    sut.create_shared_buffer.close()
+
+    assert builds == [1]
+    assert not list(sut.SHARED_DIR.glob("testing-fixtures-*-unit.bin"))
+
+
+def test_run_service() -> None:
+    """The service is reachable on its port once set up and stopped at teardown."""
+    # GIVEN
+    command = [sys.executable, "-m", "http.server", "{port}", "--bind", "127.0.0.1"]
+
+    # WHEN
+    with sut.run_service.set(command, ready_path="/") as service:
+        process = service.process
+
+        # THEN
+        with urllib.request.urlopen(f"{service.url}/") as response:  # noqa: S310
+            assert response.status == HTTPStatus.OK
+
+    sut.run_service.close()
+
+    assert process.poll() is not None
+
+
+def test_run_service_exits_during_startup() -> None:
+    """A service exiting before it is ready fails the setup with its output."""
+    # GIVEN
+    command = [sys.executable, "-c", "print('bad config'); raise SystemExit(2)"]
+
+    # WHEN
+    with (
+        pytest.raises(RuntimeError, match="exited with 2 during startup") as exc_info,
+        sut.run_service.set(command),
+    ):
+        pass
+
+    # THEN
+    assert "bad config" in str(exc_info.value)
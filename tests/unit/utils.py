@@ -1,8 +1,15 @@
 """Define fixtures for these tests."""
 
+import time
 from typing import NewType, TypedDict
 
-from testing.fixtures import FixtureDefinition, compose, compose_noinject, fixture
+from testing.fixtures import (
+    FailFast,
+    FixtureDefinition,
+    compose,
+    compose_noinject,
+    fixture,
+)
 
 Ao = NewType("Ao", str)
 
@@ -163,3 +170,128 @@ def fixture_h(h: Hi) -> FixtureDefinition[Ho]:
     yield Ho(h=h)
 
     print("Leaving h")
+
+
+Si = NewType("Si", int)
+So = NewType("So", int)
+SETUPS_S = {"count": 0, "live": 0}
+
+
+@fixture(scope="session")
+def fixture_s(s: Si) -> FixtureDefinition[So]:
+    """Session scoped fixture that counts how many times its setup has run."""
+    print("Entering s")
+    SETUPS_S["count"] += 1
+    SETUPS_S["live"] += 1
+
+    yield So(s)
+
+    SETUPS_S["live"] -= 1
+    print("Leaving s")
+
+
+Ti = NewType("Ti", str)
+TORN_DOWN_T: list[Ti] = []
+
+
+@fixture(deferred=True, barrier=True)
+def fixture_t(t: Ti, delay: float = 0.0, fail: bool = False) -> FixtureDefinition[Ti]:
+    """Fixture with a (slow and optionally failing) deferred teardown."""
+    print("Entering t")
+
+    yield t
+
+    time.sleep(delay)
+    if fail:
+        err_msg = f"teardown of {t} failed"
+        raise RuntimeError(err_msg)
+
+    TORN_DOWN_T.append(t)
+    print("Leaving t")
+
+
+Mi = NewType("Mi", int)
+Mo = NewType("Mo", int)
+SETUPS_M = {"count": 0, "live": 0}
+
+
+@fixture
+def fixture_m_base() -> FixtureDefinition[Mo]:
+    """Fixture counting its setups to be composed into fixture_m."""
+    SETUPS_M["count"] += 1
+    SETUPS_M["live"] += 1
+
+    try:
+        yield Mo(SETUPS_M["count"])
+    finally:
+        SETUPS_M["live"] -= 1
+
+
+@fixture
+@compose(fixture_m_base)
+def fixture_m(base: Mo, m: Mi) -> FixtureDefinition[tuple[Mo, Mi]]:
+    """Fixture composing fixture_m_base used to test matrices."""
+    yield (base, m)
+
+
+class BigPayload(bytearray):
+    """Large buffer (subclassed so that it can be weakly referenced)."""
+
+
+BIG_SIZE = 32 * 1024 * 1024
+
+
+@fixture
+def fixture_big(size: int = BIG_SIZE) -> FixtureDefinition[BigPayload]:
+    """Fixture yielding a large payload."""
+    yield BigPayload(size)
+
+
+Ri = NewType("Ri", str)
+ATTEMPTS_R: list[Ri] = []
+FAIL_FAST_TTL = 0.2
+
+
+@fixture(fail_fast=FailFast(ttl=FAIL_FAST_TTL, retries=1, backoff=0.0))
+def fixture_r(r: Ri, fail: bool = False) -> FixtureDefinition[Ri]:
+    """Fixture whose (optionally failing) setup attempts are recorded."""
+    ATTEMPTS_R.append(r)
+    if fail:
+        err_msg = f"{r} is unreachable"
+        raise ConnectionError(err_msg)
+
+    yield r
+
+
+Xo = NewType("Xo", dict[str, int])
+SETUPS_X = {"count": 0, "resets": 0}
+
+
+@fixture
+def fixture_x(capacity: int = 1) -> FixtureDefinition[Xo]:
+    """Fixture yielding a mutable store (reset between Hypothesis examples)."""
+    SETUPS_X["count"] += 1
+
+    yield Xo({"capacity": capacity})
+
+
+@fixture_x.example_reset
+def _reset_x(store: Xo) -> None:
+    """Restore the store between examples."""
+    SETUPS_X["resets"] += 1
+    capacity = store["capacity"]
+    store.clear()
+    store["capacity"] = capacity
+
+
+Uo = NewType("Uo", dict[str, list[int]])
+SETUPS_U: list[Uo] = []
+
+
+@fixture(scope="session", guard=True)
+def fixture_u() -> FixtureDefinition[Uo]:
+    """Session scoped (guarded) fixture yielding a mutable value."""
+    value = Uo({"items": [1, 2, 3]})
+    SETUPS_U.append(value)
+
+    yield value